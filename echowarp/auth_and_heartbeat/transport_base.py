@@ -22,6 +22,9 @@ class TransportBase:
         _is_server (bool): Indicates if the instance is running as a server.
         _client_tcp_socket (Optional[socket.socket]): Socket for TCP communication.
         _udp_socket (socket.socket): Socket for UDP communication.
+        _wakeup_reader_socket (socket.socket): Readable end of a socket pair that becomes ready on shutdown,
+        so the stream loop can wait on it together with the UDP socket.
+        _wakeup_writer_socket (socket.socket): Writable end of the shutdown socket pair.
         _udp_port (int): UDP/TCP port used for audio streaming.
         _stop_util_event (threading.Event): Event to signal when to terminate the application.
         _stop_stream_event (threading.Event): Event to signal when to stop streaming.
@@ -29,10 +32,15 @@ class TransportBase:
         _reconnect_attempt (int, optional): Allowed missed heartbeats before connection is considered lost.
         _password_base64 (Optional[str]): Base64 encoded password for authentication.
         _socket_buffer_size (int): Buffer size for the socket.
+        __heartbeat_buffer (memoryview): Preallocated buffer that heartbeat responses are received into.
+        __accepted_heartbeat_message (bytes): Serialized ACCEPTED heartbeat message, sent on every heartbeat
+        and compared against received heartbeats before falling back to parsing them.
     """
     _is_server: bool
     _client_tcp_socket: Optional[socket.socket]
     _udp_socket: socket.socket
+    _wakeup_reader_socket: socket.socket
+    _wakeup_writer_socket: socket.socket
     _udp_port: int
     _stop_util_event: threading.Event
     _stop_stream_event: threading.Event
@@ -40,6 +48,18 @@ class TransportBase:
     _reconnect_attempt: int
     _password_base64: Optional[str]
     _socket_buffer_size: int
+    __heartbeat_buffer: memoryview
+    __accepted_heartbeat_message: bytes
+
+    __AUDIO_IP_TOS = 0xB8  # DSCP Expedited Forwarding (46), the class for real-time voice traffic
+    __AUDIO_SOCKET_PRIORITY = 6
+    __UDP_BUFFER_OS_LIMITS = {
+        socket.SO_RCVBUF: ('receive', 'net.core.rmem_max'),
+        socket.SO_SNDBUF: ('send', 'net.core.wmem_max'),
+    }
+    __TCP_KEEPALIVE_IDLE = 5
+    __TCP_KEEPALIVE_INTERVAL = 5
+    __TCP_KEEPALIVE_COUNT = 3
 
     def __init__(self, settings: Settings, stop_util_event: threading.Event(), stop_stream_event: threading.Event()):
         """
@@ -59,10 +79,18 @@ class TransportBase:
 
         self._client_tcp_socket = None
         self.__initialize_udp_socket()
+        self._wakeup_reader_socket, self._wakeup_writer_socket = socket.socketpair()
 
         self._password_base64 = self.__get_base64_password(settings.password)
 
         self._socket_buffer_size = settings.socket_buffer_size
+        self.__heartbeat_buffer = memoryview(bytearray(self._socket_buffer_size))
+        self.__accepted_heartbeat_message = JSONMessage.encode_message_to_json_bytes(
+            JSONMessage.ACCEPTED_MESSAGE.response_message,
+            JSONMessage.ACCEPTED_MESSAGE.response_code,
+            None,
+            None
+        )
 
         self.__stop_message_send = False
 
@@ -135,12 +163,17 @@ class TransportBase:
     def __receive_heartbeat_and_validate(self):
         """
         Receives and validates the heartbeat message.
+        A heartbeat identical to the one this side sends is accepted without parsing its JSON.
         """
-        encrypted_response = self._client_tcp_socket.recv(self._socket_buffer_size)
-        if encrypted_response == b'':
+        received_size = self._client_tcp_socket.recv_into(self.__heartbeat_buffer)
+        if received_size == 0:
             raise ValueError('Heartbeat message from client is NULL')
 
+        encrypted_response = bytes(self.__heartbeat_buffer[:received_size])
         decrypt_response = self._crypto_manager.decrypt_aes_and_verify_data(encrypted_response)
+        if decrypt_response == self.__accepted_heartbeat_message:
+            return
+
         response_message = JSONMessage(decrypt_response)
 
         if (response_message.message == JSONMessage.LOCKED_MESSAGE.response_message and
@@ -165,12 +198,7 @@ class TransportBase:
             )
             self.__stop_message_send = True
         else:
-            message = JSONMessage.encode_message_to_json_bytes(
-                JSONMessage.ACCEPTED_MESSAGE.response_message,
-                JSONMessage.ACCEPTED_MESSAGE.response_code,
-                None,
-                None
-            )
+            message = self.__accepted_heartbeat_message
 
         self._client_tcp_socket.sendall(self._crypto_manager.encrypt_aes_and_sign_data(message))
 
@@ -315,11 +343,32 @@ class TransportBase:
 
         self._stop_util_event.set()
         self._stop_stream_event.set()
+        self.__wake_up_stream()
 
         time.sleep(5)
 
         self._cleanup_tcp_socket()
         self._cleanup_udp_socket()
+        self.__cleanup_wakeup_sockets()
+
+    def __wake_up_stream(self):
+        """
+        Makes the wakeup socket readable to interrupt a stream loop waiting for UDP data.
+        """
+        try:
+            self._wakeup_writer_socket.send(b'\0')
+        except socket.error as e:
+            logging.error(f"Error waking up stream loop: {e}")
+
+    def __cleanup_wakeup_sockets(self):
+        """
+        Cleans up the wakeup socket pair.
+        """
+        for wakeup_socket in (self._wakeup_reader_socket, self._wakeup_writer_socket):
+            try:
+                wakeup_socket.close()
+            except socket.error as e:
+                logging.error(f"Error closing wakeup socket: {e}")
 
     def __initialize_udp_socket(self):
         """
@@ -327,6 +376,73 @@ class TransportBase:
         """
         self._udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._udp_socket.settimeout(DefaultValuesAndOptions.get_timeout())
+        self.__set_udp_low_latency_priority()
+
+    def __set_udp_low_latency_priority(self):
+        """
+        Marks audio packets as low-latency traffic, so routers and the local queueing discipline send them first.
+        Sets the DSCP class in the IP header and, on Linux, the socket priority. Each option is set on its own,
+        so an option rejected by the OS or for lack of privileges does not prevent the other.
+        """
+        try:
+            self._udp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, self.__AUDIO_IP_TOS)
+        except OSError as e:
+            logging.debug(f"Failed to set UDP socket DSCP class: {e}")
+
+        if hasattr(socket, 'SO_PRIORITY'):
+            try:
+                self._udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, self.__AUDIO_SOCKET_PRIORITY)
+            except OSError as e:
+                logging.debug(f"Failed to set UDP socket priority: {e}")
+
+    def _set_udp_buffer_size(self, option: int, requested_size: int):
+        """
+        Enlarges a kernel buffer of the UDP socket, so short stalls or bursts queue audio packets instead of
+        dropping them. Logs a warning if the OS limits the buffer below the requested size.
+
+        Args:
+            option (int): socket.SO_RCVBUF or socket.SO_SNDBUF.
+            requested_size (int): Requested buffer size in bytes.
+        """
+        buffer_name, os_limit_name = self.__UDP_BUFFER_OS_LIMITS[option]
+
+        try:
+            self._udp_socket.setsockopt(socket.SOL_SOCKET, option, requested_size)
+            actual_size = self._udp_socket.getsockopt(socket.SOL_SOCKET, option)
+        except OSError as e:
+            logging.warning(f"Failed to set UDP {buffer_name} buffer size: {e}")
+            return
+
+        if actual_size < requested_size:
+            logging.warning(f"UDP {buffer_name} buffer size limited by OS to {actual_size} bytes "
+                            f"(requested {requested_size} bytes). "
+                            f"Raise the OS limit (e.g. {os_limit_name} on Linux) to avoid dropped packets.")
+
+    def _disable_tcp_nagle(self):
+        """
+        Disables Nagle's algorithm on the connected TCP socket, so small heartbeat messages are sent immediately
+        instead of being delayed until the previous segment is acknowledged.
+        """
+        try:
+            self._client_tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logging.warning(f"Failed to disable Nagle's algorithm on TCP socket: {e}")
+
+    def _enable_tcp_keepalive(self):
+        """
+        Enables TCP keepalive on the connected TCP socket, so the kernel detects a half-open connection
+        even while a heartbeat is blocked in recv. Keepalive timings not supported by the platform are skipped.
+        """
+        try:
+            self._client_tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            for option_name, value in (('TCP_KEEPIDLE', self.__TCP_KEEPALIVE_IDLE),
+                                       ('TCP_KEEPINTVL', self.__TCP_KEEPALIVE_INTERVAL),
+                                       ('TCP_KEEPCNT', self.__TCP_KEEPALIVE_COUNT)):
+                if hasattr(socket, option_name):
+                    self._client_tcp_socket.setsockopt(socket.IPPROTO_TCP, getattr(socket, option_name), value)
+        except OSError as e:
+            logging.warning(f"Failed to enable TCP keepalive: {e}")
 
     def _init_tcp_connection(self):
         """
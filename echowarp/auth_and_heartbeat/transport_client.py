@@ -1,4 +1,5 @@
 import os
+import platform
 import socket
 import logging
 import threading
@@ -17,8 +18,13 @@ class TransportClient(TransportBase, ABC):
 
     Attributes:
         _server_address (str): The IP address or hostname of the server.
+        _is_udp_kernel_timestamps (bool): True if the kernel stamps arrival time of UDP packets (SO_TIMESTAMPNS).
     """
     _server_address: str
+    _is_udp_kernel_timestamps: bool
+
+    # SO_TIMESTAMPNS (and SCM_TIMESTAMPNS) from asm-generic Linux headers, not exported by the socket module
+    _SO_TIMESTAMPNS = getattr(socket, 'SO_TIMESTAMPNS', 35)
 
     def __init__(self, settings: Settings, stop_util_event: threading.Event(), stop_stream_event: threading.Event()):
         """
@@ -30,9 +36,29 @@ class TransportClient(TransportBase, ABC):
         super().__init__(settings, stop_util_event, stop_stream_event)
         self._server_address = settings.server_address
 
+        self._set_udp_buffer_size(socket.SO_RCVBUF, DefaultValuesAndOptions.get_udp_receive_buffer_size())
+        self._is_udp_kernel_timestamps = self.__enable_udp_kernel_timestamps()
         self._udp_socket.bind(('', self._udp_port))
         self._init_tcp_connection()
 
+    def __enable_udp_kernel_timestamps(self) -> bool:
+        """
+        Asks the kernel to attach the arrival time to every received UDP packet, where the OS supports it.
+
+        Returns:
+            bool: True if kernel timestamps are enabled and can be read with recvmsg_into.
+        """
+        if platform.system() != 'Linux' or not hasattr(self._udp_socket, 'recvmsg_into'):
+            return False
+
+        try:
+            self._udp_socket.setsockopt(socket.SOL_SOCKET, self._SO_TIMESTAMPNS, 1)
+        except OSError as e:
+            logging.warning(f"Failed to enable UDP kernel timestamps: {e}")
+            return False
+
+        return True
+
     def __authenticate_on_server(self):
         """
         Performs authentication with the server using RSA encryption for the exchange of credentials.
@@ -88,8 +114,9 @@ class TransportClient(TransportBase, ABC):
                              f"{server_message.version} - Server"
                              f"{os.linesep}{client_failed_connect_str}")
 
-        self._crypto_manager.load_aes_key_and_iv(config_server_message.aes_key_base64,
-                                                 config_server_message.aes_iv_base64)
+        if config_server_message.is_encrypt:
+            self._crypto_manager.load_aes_key(config_server_message.aes_key_base64)
+
         self._crypto_manager.load_encryption_config_for_client(config_server_message.is_encrypt,
                                                                config_server_message.is_integrity_control)
 
@@ -101,6 +128,8 @@ class TransportClient(TransportBase, ABC):
 
     def _established_connection(self):
         self._client_tcp_socket.connect((self._server_address, self._udp_port))
+        self._disable_tcp_nagle()
+        self._enable_tcp_keepalive()
 
         logging.info(f"TCP connection to {self._server_address} established.")
 
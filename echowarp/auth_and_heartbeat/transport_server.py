@@ -1,5 +1,6 @@
 import logging
 import os
+import platform
 import socket
 import threading
 from abc import ABC
@@ -36,6 +37,8 @@ class TransportServer(TransportBase, ABC):
             settings (Settings): Settings object.
         """
         super().__init__(settings, stop_util_event, stop_stream_event)
+        self._udp_socket.setblocking(False)
+        self._set_udp_buffer_size(socket.SO_SNDBUF, DefaultValuesAndOptions.get_udp_send_buffer_size())
 
         self._client_address = None
         self.__ban_list = BanList(settings.reconnect_attempt)
@@ -108,13 +111,17 @@ class TransportServer(TransportBase, ABC):
 
     def __send_configuration(self):
         """
-        Sends the configuration settings to the connected client, including security settings and AES keys.
+        Sends the configuration settings to the connected client, including security settings and AES key.
+        A new AES key is generated for every session.
 
         The configuration is sent as an encrypted JSON string.
         """
+        if self._crypto_manager.is_ssl:
+            self._crypto_manager.generate_session_aes_key()
+
         config_json = JSONMessageServer.encode_server_config_to_json_bytes(
             self._crypto_manager.is_ssl, self._crypto_manager.is_integrity_control,
-            self._crypto_manager.get_aes_key_base64(), self._crypto_manager.get_aes_iv_base64(),
+            self._crypto_manager.get_aes_key_base64(),
             self.__ban_list.get_failed_connect_attempts(self._client_address), self._reconnect_attempt
         )
 
@@ -123,6 +130,10 @@ class TransportServer(TransportBase, ABC):
 
     def _initialize_socket(self):
         self._server_tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+        if platform.system() != 'Windows':
+            self._server_tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
         self._server_tcp_socket.bind(('', self._udp_port))
         self._server_tcp_socket.settimeout(DefaultValuesAndOptions.get_timeout())
         self._server_tcp_socket.listen()
@@ -151,6 +162,8 @@ class TransportServer(TransportBase, ABC):
                 continue
 
             logging.info(f"Client connected from {self._client_address}")
+            self._disable_tcp_nagle()
+            self._enable_tcp_keepalive()
 
             try:
                 self.__authenticate_client()
@@ -1,7 +1,8 @@
 import datetime
-import locale
 import logging
 
+from echowarp.models.default_values_and_options import DefaultValuesAndOptions
+
 
 class Logger:
     IS_CORE_LOGGER_ENABLED: bool = False
@@ -22,7 +23,7 @@ class Logger:
                        'funcName: %(funcName)s | '
                        '%(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S',
-                encoding=locale.getpreferredencoding()
+                encoding=DefaultValuesAndOptions.get_preferred_encoding()
             )
 
             Logger.IS_CORE_LOGGER_ENABLED = True
@@ -37,7 +38,7 @@ class Logger:
             current_date = datetime.datetime.now().strftime('%Y-%m-%d')
             file_handler = logging.FileHandler(
                 f"echowarp_errors_{current_date}.log",
-                encoding=locale.getpreferredencoding()
+                encoding=DefaultValuesAndOptions.get_preferred_encoding()
             )
             file_handler.setLevel(logging.WARNING)
 
@@ -10,9 +10,6 @@ from echowarp.logging_config import Logger
 from echowarp.start_modes.args_mode import ArgsParser
 from echowarp.start_modes.interactive_mode import InteractiveSettings
 
-from echowarp.streamer.audio_client import ClientStreamReceiver
-from echowarp.streamer.audio_server import ServerStreamer
-
 
 def graceful_shutdown(signum, frame, stop_util_event: threading.Event):
     """
@@ -41,12 +38,16 @@ def run_app(stop_util_event: threading.Event(), stop_stream_event: threading.Eve
         settings = ArgsParser.get_settings_from_cli_args()
 
     if settings.is_server:
+        from echowarp.streamer.audio_server import ServerStreamer
+
         logging.info("Starting EchoWarp in server mode")
         streamer = ServerStreamer(settings, stop_util_event, stop_stream_event)
 
         streamer_thread = threading.Thread(target=streamer.encode_audio_and_send_to_client, daemon=True)
         streamer.start_streaming(streamer_thread)
     else:
+        from echowarp.streamer.audio_client import ClientStreamReceiver
+
         logging.info("Starting EchoWarp in client mode")
         receiver = ClientStreamReceiver(settings, stop_util_event, stop_stream_event)
 
@@ -1,9 +1,14 @@
+import atexit
+import base64
+import functools
+import json
 import logging
 import os
 import platform
 import subprocess
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Mapping
+from typing import List, Optional, Mapping, Tuple, FrozenSet, Callable
 
 import chardet
 import pyaudio
@@ -22,13 +27,12 @@ class AudioDevice:
     Represents an audio device for recording or playback, handling device selection and configuration.
 
     Attributes:
-        py_audio (pyaudio.PyAudio): Instance of PyAudio used to interface with audio hardware.
+        py_audio (pyaudio.PyAudio): Instance of PyAudio used to interface with audio hardware, shared by all devices.
         device_name (str): The name of the device.
         device_index (int): The index of the device as used by PyAudio.
         channels (int): Number of audio channels supported by the device.
         sample_rate (int): The sample rate (in Hz) of the device.
     """
-    py_audio: pyaudio.PyAudio
     device_name: str
     device_id: Optional[int]
     device_index: int
@@ -37,6 +41,10 @@ class AudioDevice:
     ignore_device_encoding_names: bool
     device_encoding_names: str
 
+    __ENDPOINT_NAMES_CACHE_TTL = 30
+    __endpoint_names_cache: Optional[Tuple[float, FrozenSet[str]]] = None
+    __device_infos_cache: Optional[Tuple[Mapping, ...]] = None
+
     def __init__(self, is_input_device: bool, device_id: Optional[int], ignore_device_encoding_names: bool,
                  device_encoding_names: str):
         """
@@ -48,7 +56,6 @@ class AudioDevice:
         """
         self.is_input_device = is_input_device
         self.device_id = device_id
-        self.py_audio = pyaudio.PyAudio()
 
         self.ignore_device_encoding_names = ignore_device_encoding_names
         self.device_encoding_names = device_encoding_names
@@ -58,6 +65,51 @@ class AudioDevice:
         else:
             self.__select_audio_device_by_device_id()
 
+    @property
+    def py_audio(self) -> pyaudio.PyAudio:
+        """
+        PyAudio instance shared by all audio devices, created on first use to postpone PortAudio initialization.
+        """
+        return AudioDevice.__get_shared_py_audio()
+
+    def open_stream(self, frames_per_buffer: int = pyaudio.paFramesPerBufferUnspecified, start: bool = True,
+                    stream_callback: Optional[Callable] = None) -> pyaudio.Stream:
+        """
+        Opens a 16-bit PCM stream on the selected device, as input or output depending on the device type.
+
+        Args:
+            frames_per_buffer (int): Frames per PortAudio buffer, chosen by PortAudio if unspecified.
+            start (bool): Start the stream immediately. If False, the stream is only opened
+            and must be started with start_stream().
+            stream_callback (Optional[Callable]): PyAudio callback that exchanges audio with the device
+            from the PortAudio thread. If None, the stream is used with blocking read/write.
+
+        Returns:
+            pyaudio.Stream: The opened stream.
+        """
+        if self.is_input_device:
+            device_kwargs = {'input': True, 'input_device_index': self.device_index}
+        else:
+            device_kwargs = {'output': True, 'output_device_index': self.device_index}
+
+        return self.py_audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            frames_per_buffer=frames_per_buffer,
+            start=start,
+            stream_callback=stream_callback,
+            **device_kwargs
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def __get_shared_py_audio() -> pyaudio.PyAudio:
+        py_audio = pyaudio.PyAudio()
+        atexit.register(py_audio.terminate)
+
+        return py_audio
+
     def __select_audio_device_by_device_id(self):
         self.device_index = self.device_id
         try:
@@ -87,20 +139,22 @@ class AudioDevice:
             raise Exception(f"No connected {device_type} audio devices found!")
 
         self.__print_list_of_audio_devices(device_type, device_list)
-        device_indexes = [device.id for device in device_list]
+        devices = {device.id: device for device in device_list}
         device_index = None
 
-        while device_index not in device_indexes:
-            try:
-                device_index = input()
-                device_index = int(device_index)
-            except Exception as e:
-                logging.error(f'Selected invalid device id: {device_index}{os.linesep}{e}')
+        while device_index not in devices:
+            str_input = input().strip()
+
+            if str_input.isdecimal():
+                device_index = int(str_input)
+
+            if device_index not in devices:
+                logging.error(f'Selected invalid device id: {str_input}')
 
         self.device_index = device_index
         self.device_id = device_index
-        dev = self.py_audio.get_device_info_by_index(self.device_index)
-        self.device_name = self.__decode_string(dev['name'])
+        dev = devices[device_index].dev
+        self.device_name = devices[device_index].device_name
         self.channels = dev[f'max{device_type}Channels']
         self.sample_rate = int(dev['defaultSampleRate'])
 
@@ -110,90 +164,157 @@ class AudioDevice:
             f"Select id of {audio_device_type} audio devices:{os.linesep}"
             f"{os.linesep.join(device.audio_devices_str for device in device_list)}")
 
+    def __get_device_infos(self) -> Tuple[Mapping, ...]:
+        """
+        Returns info of all PortAudio devices. Devices are enumerated once and shared by all AudioDevice instances.
+        """
+        if AudioDevice.__device_infos_cache is None:
+            AudioDevice.__device_infos_cache = tuple(
+                self.py_audio.get_device_info_by_index(i) for i in range(self.py_audio.get_device_count())
+            )
+
+        return AudioDevice.__device_infos_cache
+
     def __get_id_list_of_devices(self, device_type: str) -> List[Device]:
         device_list = []
-        device_count = self.py_audio.get_device_count()
+        device_infos = self.__get_device_infos()
 
-        if device_count == 0:
+        if len(device_infos) == 0:
             raise Exception(f"No connected audio devices found!")
 
-        for i in range(device_count):
-            dev = self.py_audio.get_device_info_by_index(i)
+        channels_key = f'max{device_type}Channels'
 
-            device_name = self.__decode_string(dev['name'])
+        for i, dev in enumerate(device_infos):
+            channels = dev[channels_key]
 
-            if dev[f'max{device_type}Channels'] > 0:
+            if channels > 0:
+                device_name = self.__decode_string(dev['name'])
                 audio_devices_str = (
                     f"{i}: {device_name}, "
-                    f"Channels: {dev[f'max{device_type}Channels']}, "
+                    f"Channels: {channels}, "
                     f"Sample rate: {int(dev['defaultSampleRate'])}Hz"
                 )
                 device_list.append(Device(i, dev, device_name, audio_devices_str))
 
         if platform.system() == 'Windows':
-            device_list = self.__get_data_from_powershell(device_list)
+            device_list = self.__get_data_from_windows_endpoints(device_list)
 
         return device_list
 
-    def __get_data_from_powershell(self, device_list: List[Device]) -> List[Device]:
-        command = """
-            $OutputEncoding = [Console]::OutputEncoding = [System.Text.Encoding]::UTF8;
-            Get-PnpDevice | 
-            Where-Object { $_.Class -eq 'AudioEndpoint' -and $_.Status -eq 'OK' } | 
-            Select-Object Name | 
-            Out-String
-            """
-
+    def __get_data_from_windows_endpoints(self, device_list: List[Device]) -> List[Device]:
         try:
-            result = subprocess.run(["powershell", "-Command", command], capture_output=True, text=True,
-                                    encoding='utf-8')
-            ps_device_names = self.__parse_powershell_stdout(result.stdout)
+            endpoint_names = self.__get_active_endpoint_names()
         except Exception as e:
-            logging.warning(f"Failed to get device names from PowerShell: {e}")
+            logging.warning(f"Failed to get names of active Windows audio endpoints: {e}")
 
             return device_list
 
-        py_audio_device_names = [device.device_name for device in device_list]
-        is_ps_device_names_exists = any(ps_device_name in py_audio_device_names for ps_device_name in ps_device_names)
+        sized_device_list = [device for device in device_list if device.device_name in endpoint_names]
 
-        if not is_ps_device_names_exists:
+        if len(sized_device_list) == 0:
             logging.warning("Failed to size list of Windows audio devices!")
 
             return device_list
         else:
-            sized_device_list = device_list.copy()
-            for id_device in device_list:
-                if id_device.device_name not in ps_device_names:
-                    sized_device_list.remove(id_device)
-
             return sized_device_list
 
     @staticmethod
-    def __parse_powershell_stdout(stdout: str) -> List[str]:
-        lines = stdout.split('\n')
-        device_names = []
-        collect_names = False
+    def __get_active_endpoint_names() -> FrozenSet[str]:
+        """
+        Returns names of active Windows audio endpoints, shared by all AudioDevice instances.
+        Endpoints are queried again only after the cached names are older than the cache TTL.
+        """
+        now = time.monotonic()
+        cache = AudioDevice.__endpoint_names_cache
+
+        if cache is None or now - cache[0] > AudioDevice.__ENDPOINT_NAMES_CACHE_TTL:
+            cache = (now, AudioDevice.__query_active_endpoint_names())
+            AudioDevice.__endpoint_names_cache = cache
+
+        return cache[1]
+
+    @staticmethod
+    def __query_active_endpoint_names() -> FrozenSet[str]:
+        """
+        Enumerates active endpoints through the Windows Core Audio API and falls back to PowerShell
+        if pycaw is not installed or the COM call fails.
+        """
+        try:
+            return AudioDevice.__query_core_audio_device_names()
+        except Exception as e:
+            logging.warning(f"Failed to get device names from Windows Core Audio, using PowerShell: {e}")
+
+        return AudioDevice.__query_powershell_device_names()
+
+    @staticmethod
+    def __query_core_audio_device_names() -> FrozenSet[str]:
+        from pycaw.utils import AudioUtilities, AudioDeviceState
+
+        return frozenset(device.FriendlyName for device in AudioUtilities.GetAllDevices()
+                         if device.state == AudioDeviceState.Active and device.FriendlyName)
+
+    @staticmethod
+    def __query_powershell_device_names() -> FrozenSet[str]:
+        command = """
+            $OutputEncoding = [Console]::OutputEncoding = [System.Text.Encoding]::UTF8;
+            ConvertTo-Json -Compress -InputObject @(
+                Get-PnpDevice |
+                Where-Object { $_.Class -eq 'AudioEndpoint' -and $_.Status -eq 'OK' } |
+                Select-Object -ExpandProperty Name
+            )
+            """
 
-        for line in lines:
-            if '----' in line:
-                collect_names = True
-                continue
+        encoded_command = base64.b64encode(command.encode('utf-16-le')).decode('ascii')
 
-            if collect_names and line.strip():
-                device_names.append(line.strip())
+        result = subprocess.run(
+            ["powershell", "-NoProfile", "-NonInteractive", "-NoLogo", "-ExecutionPolicy", "Bypass",
+             "-EncodedCommand", encoded_command],
+            capture_output=True,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
 
-        return device_names
+        return frozenset(AudioDevice.__parse_powershell_stdout(result.stdout))
+
+    @staticmethod
+    def __parse_powershell_stdout(stdout: bytes) -> List[str]:
+        """
+        Parses device names from the JSON printed by PowerShell.
+        ConvertTo-Json may print a bare string for a single name and nothing at all for no names.
+        """
+        if not stdout.strip():
+            return []
+
+        names = json.loads(stdout)
+
+        if isinstance(names, str):
+            names = [names]
+
+        return [name for name in names if name]
 
     def __decode_string(self, string: str) -> str:
-        if self.ignore_device_encoding_names:
+        """
+        Restores a device name that was decoded with the wrong encoding.
+        ASCII names read the same in every ASCII-compatible encoding, so they are returned as is.
+        The name is encoded once and decoded as UTF-8, or with the encoding detected by chardet.
+
+        Args:
+            string (str): Device name as reported by PortAudio.
+
+        Returns:
+            str: Decoded device name, or the original name if it cannot be decoded.
+        """
+        if self.ignore_device_encoding_names or string.isascii():
             return string
 
         try:
-            return string.encode(self.device_encoding_names).decode('utf-8')
-        except (UnicodeEncodeError, UnicodeDecodeError):
+            encoded_string = string.encode(self.device_encoding_names)
+        except UnicodeEncodeError:
+            return string
+
+        try:
+            return encoded_string.decode('utf-8')
+        except UnicodeDecodeError:
             try:
-                return string.encode(self.device_encoding_names).decode(
-                    chardet.detect(string.encode(self.device_encoding_names))['encoding']
-                )
-            except (UnicodeEncodeError, UnicodeDecodeError):
+                return encoded_string.decode(chardet.detect(encoded_string)['encoding'])
+            except UnicodeDecodeError:
                 return string
@@ -1,4 +1,3 @@
-import locale
 import logging
 import os
 from typing import Dict
@@ -114,7 +113,8 @@ class BanList:
 
         if len(banned_clients) > 0:
             try:
-                with open(DefaultValuesAndOptions.BAN_LIST_FILE, 'w', encoding=locale.getpreferredencoding()) as file:
+                with open(DefaultValuesAndOptions.BAN_LIST_FILE, 'w',
+                          encoding=DefaultValuesAndOptions.get_preferred_encoding()) as file:
                     file.write(os.linesep.join(banned_clients))
             except Exception as e:
                 logging.error(f'Failed to update ban list file: {e}')
@@ -28,6 +28,15 @@ class DefaultValuesAndOptions:
     __DEFAULT_BUFFER_SIZE = 6144
     __DEFAULT_TIMEOUT = 5
     __DEFAULT_HEARTBEAT_DELAY = 2
+    __DEFAULT_UDP_RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+    __DEFAULT_UDP_SEND_BUFFER_SIZE = 2 * 1024 * 1024
+    __DEFAULT_PREBUFFER_PACKETS = 2
+    __DEFAULT_MAX_PREBUFFER_PACKETS = 8
+    __DEFAULT_BUFFER_DURATION_MS = 20
+    # Largest per-packet overhead: 2 B sequence number + 32 B SHA-256 hash (AES-GCM adds 12 B nonce + 16 B tag)
+    __MAX_PACKET_OVERHEAD_SIZE = 34
+    __DEFAULT_CAPTURE_QUEUE_SIZE = 8
+    __PREFERRED_ENCODING = locale.getpreferredencoding()
 
     CONFIG_TITLE = 'echowarp_conf'
     BAN_LIST_FILE = 'echowarp_ban_list.txt'
@@ -55,8 +64,8 @@ class DefaultValuesAndOptions:
     ]
 
     __DEFAULT_DEVICE_ENCODING_NAMES = [
-        f'Use standard charset encoding of OS for audio device names ({locale.getpreferredencoding()})',
-        locale.getpreferredencoding()]
+        f'Use standard charset encoding of OS for audio device names ({__PREFERRED_ENCODING})',
+        __PREFERRED_ENCODING]
     __DEVICE_ENCODING_NAMES_OPTIONS = [
         __DEFAULT_DEVICE_ENCODING_NAMES,
         ['Use custom charset encoding for audio device names', True]
@@ -92,78 +101,63 @@ class DefaultValuesAndOptions:
         __DEFAULT_SAVE_PROFILE
     ]
 
+    __VARIANTS_CONFIG_LOAD_OPTIONS_DATA = OptionsData(
+        ["Load config from file", True],
+        [
+            ["Load config from file", True],
+            ["Skip configs", False]
+        ]
+    )
+    __SOCKET_BUFFER_SIZE_OPTIONS_DATA = OptionsData(__DEFAULT_SOCKET_BUFFER_SIZE, __SOCKET_BUFFER_SIZE_OPTIONS)
+    __UTIL_MODS_OPTIONS_DATA = OptionsData(__DEFAULT_SERVER_MODE, __SERVER_MODE_OPTIONS)
+    __AUDIO_DEVICE_TYPE_OPTIONS_DATA = OptionsData(__DEFAULT_AUDIO_DEVICE_TYPE, __AUDIO_DEVICE_OPTIONS)
+    __ENCODING_CHARSET_OPTIONS_DATA = OptionsData(__DEFAULT_DEVICE_ENCODING_NAMES, __DEVICE_ENCODING_NAMES_OPTIONS)
+    __IGNORE_ENCODING_OPTIONS_DATA = OptionsData(__DEFAULT_IGNORE_DEVICE_ENCODING_NAMES,
+                                                 __IGNORE_DEVICE_ENCODING_NAMES_OPTIONS)
+    __ERROR_LOG_OPTIONS_DATA = OptionsData(__DEFAULT_IS_ERROR_LOG, __IS_ERROR_LOG_OPTIONS)
+    __SSL_OPTIONS_DATA = OptionsData(__DEFAULT_SSL, __SSL_OPTIONS)
+    __HASH_CONTROL_OPTIONS_DATA = OptionsData(__DEFAULT_HASH_CONTROL, __HASH_CONTROL_OPTIONS)
+    __SAVE_PROFILE_OPTIONS_DATA = OptionsData(__DEFAULT_SAVE_PROFILE, __SAVE_PROFILE_OPTIONS)
+
     @staticmethod
     def get_variants_config_load_options_data() -> OptionsData:
-        return OptionsData(
-            ["Load config from file", True],
-            [
-                ["Load config from file", True],
-                ["Skip configs", False]
-            ]
-        )
+        return DefaultValuesAndOptions.__VARIANTS_CONFIG_LOAD_OPTIONS_DATA
 
     @staticmethod
     def get_socket_buffer_size_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_SOCKET_BUFFER_SIZE,
-            DefaultValuesAndOptions.__SOCKET_BUFFER_SIZE_OPTIONS
-        )
+        return DefaultValuesAndOptions.__SOCKET_BUFFER_SIZE_OPTIONS_DATA
 
     @staticmethod
     def get_util_mods_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_SERVER_MODE,
-            DefaultValuesAndOptions.__SERVER_MODE_OPTIONS
-        )
+        return DefaultValuesAndOptions.__UTIL_MODS_OPTIONS_DATA
 
     @staticmethod
     def get_audio_device_type_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_AUDIO_DEVICE_TYPE,
-            DefaultValuesAndOptions.__AUDIO_DEVICE_OPTIONS
-        )
+        return DefaultValuesAndOptions.__AUDIO_DEVICE_TYPE_OPTIONS_DATA
 
     @staticmethod
     def get_encoding_charset_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_DEVICE_ENCODING_NAMES,
-            DefaultValuesAndOptions.__DEVICE_ENCODING_NAMES_OPTIONS
-        )
+        return DefaultValuesAndOptions.__ENCODING_CHARSET_OPTIONS_DATA
 
     @staticmethod
     def get_ignore_encoding_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_IGNORE_DEVICE_ENCODING_NAMES,
-            DefaultValuesAndOptions.__IGNORE_DEVICE_ENCODING_NAMES_OPTIONS
-        )
+        return DefaultValuesAndOptions.__IGNORE_ENCODING_OPTIONS_DATA
 
     @staticmethod
     def get_error_log_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_IS_ERROR_LOG,
-            DefaultValuesAndOptions.__IS_ERROR_LOG_OPTIONS
-        )
+        return DefaultValuesAndOptions.__ERROR_LOG_OPTIONS_DATA
 
     @staticmethod
     def get_ssl_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_SSL,
-            DefaultValuesAndOptions.__SSL_OPTIONS
-        )
+        return DefaultValuesAndOptions.__SSL_OPTIONS_DATA
 
     @staticmethod
     def get_hash_control_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_HASH_CONTROL,
-            DefaultValuesAndOptions.__HASH_CONTROL_OPTIONS
-        )
+        return DefaultValuesAndOptions.__HASH_CONTROL_OPTIONS_DATA
 
     @staticmethod
     def get_save_profile_options_data() -> OptionsData:
-        return OptionsData(
-            DefaultValuesAndOptions.__DEFAULT_SAVE_PROFILE,
-            DefaultValuesAndOptions.__SAVE_PROFILE_OPTIONS
-        )
+        return DefaultValuesAndOptions.__SAVE_PROFILE_OPTIONS_DATA
 
     @staticmethod
     def get_default_port() -> int:
@@ -188,3 +182,48 @@ class DefaultValuesAndOptions:
     @staticmethod
     def get_timeout() -> int:
         return DefaultValuesAndOptions.__DEFAULT_TIMEOUT
+
+    @staticmethod
+    def get_udp_receive_buffer_size() -> int:
+        return DefaultValuesAndOptions.__DEFAULT_UDP_RECEIVE_BUFFER_SIZE
+
+    @staticmethod
+    def get_udp_send_buffer_size() -> int:
+        return DefaultValuesAndOptions.__DEFAULT_UDP_SEND_BUFFER_SIZE
+
+    @staticmethod
+    def get_prebuffer_packets() -> int:
+        return DefaultValuesAndOptions.__DEFAULT_PREBUFFER_PACKETS
+
+    @staticmethod
+    def get_max_prebuffer_packets() -> int:
+        return DefaultValuesAndOptions.__DEFAULT_MAX_PREBUFFER_PACKETS
+
+    @staticmethod
+    def get_frames_per_buffer(sample_rate: int, channels: int, socket_buffer_size: int) -> int:
+        """
+        Returns the number of frames in one audio buffer, a whole number of milliseconds at the given sample rate,
+        e.g. 960 frames at 48 kHz. The buffer is shortened if the packet carrying it, including its headers,
+        would not fit into the socket buffer, since the client drops truncated packets.
+
+        Args:
+            sample_rate (int): Sample rate of the audio device in Hz.
+            channels (int): Number of audio channels, 16-bit samples each.
+            socket_buffer_size (int): Socket buffer size, the largest packet the client receives whole.
+
+        Returns:
+            int: Frames per audio buffer.
+        """
+        duration_frames = sample_rate * DefaultValuesAndOptions.__DEFAULT_BUFFER_DURATION_MS // 1000
+        max_packet_frames = ((socket_buffer_size - DefaultValuesAndOptions.__MAX_PACKET_OVERHEAD_SIZE)
+                             // (channels * 2))
+
+        return max(1, min(duration_frames, max_packet_frames))
+
+    @staticmethod
+    def get_capture_queue_size() -> int:
+        return DefaultValuesAndOptions.__DEFAULT_CAPTURE_QUEUE_SIZE
+
+    @staticmethod
+    def get_preferred_encoding() -> str:
+        return DefaultValuesAndOptions.__PREFERRED_ENCODING
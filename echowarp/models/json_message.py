@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 from dataclasses import dataclass
@@ -5,6 +6,11 @@ from typing import Optional
 
 from echowarp.models.default_values_and_options import DefaultValuesAndOptions
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class ResponseMessage:
@@ -44,6 +50,8 @@ class JSONMessage:
     _FAILED_CONNECTIONS_KEY = "failed_connections"
     _RECONNECT_ATTEMPTS_KEY = "reconnect_attempts"
 
+    _COMPARABILITY_VERSION = DefaultValuesAndOptions.get_util_comparability_version()
+
     def __init__(self, json_bytes: bytes):
         """
                 Initializes a new instance of JSONMessage from a byte array containing a JSON string.
@@ -55,7 +63,7 @@ class JSONMessage:
                     Exception: If there is an error decoding the JSON data.
         """
         try:
-            self._json_message = json.loads(json_bytes.decode('utf-8'))
+            self._json_message = self._load_from_json_bytes(json_bytes)
 
             self.message = self._json_message[self._MESSAGE_KEY]
             self.response_code = self._json_message[self._RESPONSE_CODE]
@@ -67,10 +75,12 @@ class JSONMessage:
             raise
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def encode_message_to_json_bytes(message: str, response_code: int,
                                      failed_connections: Optional[int], reconnect_attempts: Optional[int]) -> bytes:
         """
                 Encodes a message with its response code and version into a byte array containing JSON data.
+                Results are cached, so repeated heartbeat messages are serialized only once.
 
                 Args:
                     message (str): The main content of the message.
@@ -87,11 +97,43 @@ class JSONMessage:
         message = {
             JSONMessage._MESSAGE_KEY: message,
             JSONMessage._RESPONSE_CODE: response_code,
-            JSONMessage._COMPARABILITY_VERSION_KEY: DefaultValuesAndOptions.get_util_comparability_version(),
+            JSONMessage._COMPARABILITY_VERSION_KEY: JSONMessage._COMPARABILITY_VERSION,
             JSONMessageServer._FAILED_CONNECTIONS_KEY: failed_connections,
             JSONMessageServer._RECONNECT_ATTEMPTS_KEY: reconnect_attempts,
         }
 
+        return JSONMessage._dump_to_json_bytes(message)
+
+    @staticmethod
+    def _load_from_json_bytes(json_bytes: bytes) -> dict:
+        """
+        Parses JSON bytes with orjson if it is installed, otherwise with the standard json module.
+
+        Args:
+            json_bytes (bytes): A byte array containing the JSON-encoded string.
+
+        Returns:
+            dict: The decoded JSON object.
+        """
+        if orjson is not None:
+            return orjson.loads(json_bytes)
+
+        return json.loads(json_bytes)
+
+    @staticmethod
+    def _dump_to_json_bytes(message: dict) -> bytes:
+        """
+        Serializes a message with orjson if it is installed, otherwise with the standard json module.
+
+        Args:
+            message (dict): The message to serialize.
+
+        Returns:
+            bytes: A byte array containing the UTF-8 JSON-encoded message.
+        """
+        if orjson is not None:
+            return orjson.dumps(message)
+
         return json.dumps(message).encode('utf-8')
 
 
@@ -103,19 +145,17 @@ class JSONMessageServer(JSONMessage):
     Attributes:
         is_encrypt (bool): Indicates if encryption is enabled for the communication.
         is_integrity_control (bool): Indicates if data integrity checks are enabled.
-        aes_key_base64 (bytes): AES key used for encryption, provided as a base64-encoded string.
-        aes_iv_base64 (bytes): AES initialization vector used for encryption, provided as a base64-encoded string.
+        aes_key_base64 (Optional[str]): AES key used for encryption, provided as a base64-encoded string.
+        None if encryption is disabled.
     """
     is_encrypt: bool
     is_integrity_control: bool
-    aes_key_base64: str
-    aes_iv_base64: str
+    aes_key_base64: Optional[str]
 
     _CONFIGS_KEY = "config"
     _IS_ENCRYPT_KEY = "is_encrypt"
     _IS_INTEGRITY_CONTROL_KEY = "is_integrity_control"
     _AES_KEY = "aes_key"
-    _AES_IV_KEY = "aes_iv"
 
     def __init__(self, json_bytes: bytes):
         """
@@ -130,12 +170,13 @@ class JSONMessageServer(JSONMessage):
         """
         super().__init__(json_bytes)
 
-        if self._CONFIGS_KEY in self._json_message:
+        configs = self._json_message.get(self._CONFIGS_KEY)
+
+        if configs is not None:
             try:
-                self.is_encrypt = self._json_message[self._CONFIGS_KEY][self._IS_ENCRYPT_KEY]
-                self.is_integrity_control = self._json_message[self._CONFIGS_KEY][self._IS_INTEGRITY_CONTROL_KEY]
-                self.aes_key_base64 = self._json_message[self._CONFIGS_KEY][self._AES_KEY]
-                self.aes_iv_base64 = self._json_message[self._CONFIGS_KEY][self._AES_IV_KEY]
+                self.is_encrypt = configs[self._IS_ENCRYPT_KEY]
+                self.is_integrity_control = configs[self._IS_INTEGRITY_CONTROL_KEY]
+                self.aes_key_base64 = configs[self._AES_KEY]
             except Exception as e:
                 raise Exception(f"Decode json message error: {e}")
         else:
@@ -143,16 +184,15 @@ class JSONMessageServer(JSONMessage):
 
     @staticmethod
     def encode_server_config_to_json_bytes(is_encrypt: bool, is_hash_control: bool,
-                                           aes_key_base64: str, aes_iv_base64: str,
-                                           failed_connections: int, reconnect_attempts: int) -> bytes:
+                                           aes_key_base64: Optional[str], failed_connections: int,
+                                           reconnect_attempts: int) -> bytes:
         """
         Encodes server configuration into a byte array containing JSON data.
 
         Args:
             is_encrypt (bool): Enable or disable encryption.
             is_hash_control (bool): Enable or disable integrity control.
-            aes_key_base64 (str): AES key in Base64 for encryption.
-            aes_iv_base64 (str): AES initialization vector in Base64.
+            aes_key_base64 (Optional[str]): AES key in Base64 for encryption, None if encryption is disabled.
             failed_connections (int): Failed connections if client.
             reconnect_attempts (int): Max reconnect attempts on server.
 
@@ -165,7 +205,7 @@ class JSONMessageServer(JSONMessage):
         config = {
             JSONMessageServer._MESSAGE_KEY: JSONMessageServer.OK_MESSAGE.response_message,
             JSONMessageServer._RESPONSE_CODE: JSONMessageServer.OK_MESSAGE.response_code,
-            JSONMessageServer._COMPARABILITY_VERSION_KEY: DefaultValuesAndOptions.get_util_comparability_version(),
+            JSONMessageServer._COMPARABILITY_VERSION_KEY: JSONMessageServer._COMPARABILITY_VERSION,
             JSONMessageServer._FAILED_CONNECTIONS_KEY: failed_connections,
             JSONMessageServer._RECONNECT_ATTEMPTS_KEY: reconnect_attempts,
 
@@ -173,8 +213,7 @@ class JSONMessageServer(JSONMessage):
                 JSONMessageServer._IS_ENCRYPT_KEY: is_encrypt,
                 JSONMessageServer._IS_INTEGRITY_CONTROL_KEY: is_hash_control,
                 JSONMessageServer._AES_KEY: aes_key_base64,
-                JSONMessageServer._AES_IV_KEY: aes_iv_base64,
             }
         }
 
-        return json.dumps(config).encode('utf-8')
+        return JSONMessageServer._dump_to_json_bytes(config)
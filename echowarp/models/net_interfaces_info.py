@@ -17,12 +17,17 @@ class NetInterfacesInfo:
     __port: int
     __interface_info_list: List[InterfaceInfo]
     __is_different_dns: bool
+    __formatted_info_str: str
 
     def __init__(self, port: int):
         self.__port = port
         self.__interface_info_list, self.__is_different_dns = self.__get_net_interfaces_list()
+        self.__formatted_info_str = self.__format_info_str()
 
     def get_formatted_info_str(self) -> str:
+        return self.__formatted_info_str
+
+    def __format_info_str(self) -> str:
         if len(self.__interface_info_list) == 1:
             formatted_str = [
                     (f'Interface name: {interface.interface_name}, '
@@ -1,16 +1,14 @@
-from typing import List, Any
+from typing import List, Any, NamedTuple
 
 
-class OptionsFormatter:
+class OptionsFormatter(NamedTuple):
     option_descr: str
     option_value: Any
 
-    def __init__(self, option_list: List):
-        self.option_descr = option_list[0]
-        self.option_value = option_list[1]
-
 
 class OptionsData:
+    __slots__ = ('default_descr', 'default_value', 'options')
+
     default_descr: str
     default_value: Any
     options: List[OptionsFormatter]
@@ -19,4 +17,4 @@ class OptionsData:
         self.default_descr = default_value_list[0]
         self.default_value = default_value_list[1]
 
-        self.options = [OptionsFormatter(option) for option in options]
+        self.options = [OptionsFormatter(*option) for option in options]
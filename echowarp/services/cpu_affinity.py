@@ -0,0 +1,62 @@
+import logging
+import os
+from typing import Optional, Set
+
+
+class CpuAffinity:
+    """
+    Pins the calling thread to the CPU cores listed in the ECHOWARP_CPU_AFFINITY environment variable,
+    e.g. "2", "2,3" or "2-3". Pinning the audio thread to a core close to the NIC interrupts avoids
+    cache-line bouncing between cores. Supported only where the OS exposes sched_setaffinity (Linux).
+    """
+    __ENV_VARIABLE = 'ECHOWARP_CPU_AFFINITY'
+
+    @staticmethod
+    def pin_current_thread():
+        """
+        Pins the calling thread to the configured cores. Does nothing if no cores are configured,
+        logs a warning if the value is invalid or pinning is not supported.
+        """
+        env_value = os.environ.get(CpuAffinity.__ENV_VARIABLE)
+        if not env_value:
+            return
+
+        if not hasattr(os, 'sched_setaffinity'):
+            logging.warning(f"{CpuAffinity.__ENV_VARIABLE} is set, but CPU affinity is not supported on this OS")
+            return
+
+        cores = CpuAffinity.__parse_cores(env_value)
+        if cores is None:
+            logging.warning(f"Invalid {CpuAffinity.__ENV_VARIABLE} value: {env_value}")
+            return
+
+        try:
+            os.sched_setaffinity(0, cores)
+        except OSError as e:
+            logging.warning(f"Failed to set CPU affinity to cores {sorted(cores)}: {e}")
+            return
+
+        logging.info(f"Thread pinned to CPU cores {sorted(cores)}")
+
+    @staticmethod
+    def __parse_cores(env_value: str) -> Optional[Set[int]]:
+        """
+        Parses a comma-separated list of cores and core ranges.
+
+        Args:
+            env_value (str): Value like "0,2-3".
+
+        Returns:
+            Optional[Set[int]]: Set of cores, or None if the value is invalid.
+        """
+        cores = set()
+
+        for part in env_value.split(','):
+            first, _, last = part.strip().partition('-')
+
+            if not first.isdecimal() or (last and not last.isdecimal()):
+                return None
+
+            cores.update(range(int(first), int(last or first) + 1))
+
+        return cores or None
@@ -1,14 +1,14 @@
 import base64
+import itertools
 import logging
-import os
 import hashlib
+import struct
 from typing import Tuple, Optional
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives import padding as sym_padding
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 
 class CryptoManager:
@@ -21,8 +21,12 @@ class CryptoManager:
         is_integrity_control (bool): Determines if integrity control via hashing is enabled.
         __private_key (rsa.RSAPrivateKey): The RSA private key for decryption.
         __public_key (rsa.RSAPublicKey): The RSA public key for encryption.
-        __aes_key (Optional[bytes]): The AES key for symmetric encryption, used if encryption is enabled.
-        __aes_iv (Optional[bytes]): The AES IV for symmetric encryption.
+        __aes_key (Optional[bytes]): The AES key for symmetric encryption, generated by the server
+        for every authenticated session if encryption is enabled.
+        __aes_gcm (Optional[AESGCM]): AES-GCM cipher bound to the AES key, encrypts and authenticates in one pass.
+        __nonce_direction (int): Fixed field of AES-GCM nonces, different for server and client,
+        so both sides never produce the same nonce under the shared session key.
+        __nonce_counter (itertools.count): Monotonic counter of AES-GCM nonces, never reset for the instance lifetime.
         __peer_public_key (Optional[rsa.RSAPublicKey]): The public key of the communication peer,
         for encrypted communications.
     """
@@ -32,9 +36,16 @@ class CryptoManager:
     __private_key: rsa.RSAPrivateKey
     __public_key: rsa.RSAPublicKey
     __aes_key: Optional[bytes]
-    __aes_iv: Optional[bytes]
+    __aes_gcm: Optional[AESGCM]
+    __nonce_direction: int
+    __nonce_counter: itertools.count
     __peer_public_key: rsa.RSAPublicKey
 
+    __AES_GCM_NONCE_SIZE = 12
+    __NONCE_STRUCT = struct.Struct('>IQ')
+    __SERVER_NONCE_DIRECTION = 0
+    __CLIENT_NONCE_DIRECTION = 1
+
     def __init__(self, is_server: bool, is_integrity_control: bool, is_ssl: bool):
         """
                 Initializes a new CryptoManager instance with the specified settings.
@@ -49,7 +60,10 @@ class CryptoManager:
         self.is_integrity_control = is_integrity_control
 
         self.__private_key, self.__public_key = self.__generate_and_get_rsa_keys()
-        self.__aes_key, self.__aes_iv = self.__generate_and_get_aes_key_and_iv() if is_server else (None, None)
+        self.__aes_key = None
+        self.__aes_gcm = None
+        self.__nonce_direction = self.__SERVER_NONCE_DIRECTION if is_server else self.__CLIENT_NONCE_DIRECTION
+        self.__nonce_counter = itertools.count()
 
     def load_encryption_config_for_client(self, is_encrypt: bool, is_hash_control: bool):
         if self.__is_server:
@@ -61,6 +75,7 @@ class CryptoManager:
     def encrypt_aes_and_sign_data(self, data: bytes) -> bytes:
         """
         Encrypts and optionally signs data with a hash for integrity.
+        AES-GCM already authenticates the ciphertext, so the hash is only added when encryption is disabled.
 
         Args:
             data (bytes): Data to encrypt and sign.
@@ -68,6 +83,26 @@ class CryptoManager:
         Returns:
             bytes: Encrypted (and optionally signed) data.
 
+        Raises:
+            ValueError: If data is None.
+            Exception: General exceptions during encryption, logged as an error.
+        """
+        return b''.join(self.encrypt_aes_and_sign_data_buffers(data))
+
+    def encrypt_aes_and_sign_data_buffers(self, data: bytes,
+                                          associated_data: Optional[bytes] = None) -> Tuple[bytes, ...]:
+        """
+        Same as encrypt_aes_and_sign_data, but returns the message as separate buffers (nonce or hash, then payload)
+        without joining them, so they can be sent with one scatter-gather call instead of being copied together.
+
+        Args:
+            data (bytes): Data to encrypt and sign.
+            associated_data (Optional[bytes]): Data sent in the clear next to the message, e.g. a header.
+            It is authenticated by AES-GCM or covered by the hash, and must be passed again to decrypt.
+
+        Returns:
+            Tuple[bytes, ...]: Buffers of the encrypted (and optionally signed) data, in order.
+
         Raises:
             ValueError: If data is None.
             Exception: General exceptions during encryption, logged as an error.
@@ -75,44 +110,44 @@ class CryptoManager:
         if data is None:
             raise ValueError("Data to encrypt and sign cannot be None")
 
-        if self.is_integrity_control:
-            data = self.__calculate_hash_to_data(data)
-
         if self.is_ssl:
             try:
-                data = self.__encrypt_data_aes(data)
+                return self.__encrypt_data_aes(data, associated_data)
             except Exception as e:
                 logging.error(f"Failed to encrypt data: {e}")
                 raise
+        elif self.is_integrity_control:
+            return self.__calculate_hash_to_data(data, associated_data)
 
-        return data
+        return data,
 
-    def decrypt_aes_and_verify_data(self, data: bytes) -> bytes:
+    def decrypt_aes_and_verify_data(self, data: bytes, associated_data: Optional[bytes] = None) -> bytes:
         """
         Decrypts and optionally verifies data integrity using a hash.
 
         Args:
             data (bytes): Data to decrypt and verify.
+            associated_data (Optional[bytes]): Data received in the clear next to the message,
+            verified together with it. Must match what was passed on encryption.
 
         Returns:
             bytes: Decrypted data, with integrity optionally verified.
 
         Raises:
-            ValueError: If data is None.
-            Exception: General exceptions during decryption, logged as an error.
+            ValueError: If data is None, cannot be decrypted or fails the integrity check.
+            Failures are not logged here, since the audio stream may reject many packets in a row;
+            the caller decides how to report them.
         """
         if data is None:
             raise ValueError("Data to decrypt and verify cannot be None")
 
         if self.is_ssl:
             try:
-                data = self.__decrypt_data_aes(data)
+                data = self.__decrypt_data_aes(data, associated_data)
             except Exception as e:
-                logging.error(f"Failed to decrypt data: {e}")
-                raise
-
-        if self.is_integrity_control:
-            data = self.__compare_hash_and_get_data(data)
+                raise ValueError(f"Failed to decrypt data: {e!r}") from e
+        elif self.is_integrity_control:
+            data = self.__compare_hash_and_get_data(data, associated_data)
 
         return data
 
@@ -191,93 +226,98 @@ class CryptoManager:
         )
 
     @staticmethod
-    def __generate_and_get_aes_key_and_iv() -> Tuple[bytes, bytes]:
+    def __generate_and_get_aes_key() -> bytes:
         """
-        Generates a new AES key and IV for symmetric encryption.
+        Generates a new AES key for symmetric encryption.
         """
-        aes_key = os.urandom(32)
-        aes_iv = os.urandom(16)
-
-        return aes_key, aes_iv
+        return AESGCM.generate_key(bit_length=256)
 
-    def get_aes_key_base64(self) -> str:
+    def generate_session_aes_key(self):
         """
-        Returns the AES key in Base64.
+        Generates a new AES key for the next authenticated session, so no key outlives its session.
         """
+        if not self.__is_server:
+            logging.error("Only server can generate AES key")
+            raise ValueError
 
-        return base64.b64encode(self.__aes_key).decode('utf-8')
+        self.__aes_key = self.__generate_and_get_aes_key()
+        self.__aes_gcm = AESGCM(self.__aes_key)
 
-    def get_aes_iv_base64(self) -> str:
+    def get_aes_key_base64(self) -> Optional[str]:
         """
-        Returns the AES IV in Base64.
+        Returns the AES key in Base64, or None if encryption is disabled and no key was generated.
         """
+        if self.__aes_key is None:
+            return None
 
-        return base64.b64encode(self.__aes_iv).decode('utf-8')
+        return base64.b64encode(self.__aes_key).decode('utf-8')
 
-    def load_aes_key_and_iv(self, aes_key_base64: str, aes_iv_base64: str):
+    def load_aes_key(self, aes_key_base64: str):
         """
-        Loads the AES key and IV from peer.
+        Loads the AES key from peer.
         """
         if self.__is_server:
-            logging.error("Only client can load AES key and IV")
+            logging.error("Only client can load AES key")
             raise ValueError
 
         self.__aes_key = base64.b64decode(aes_key_base64)
-        self.__aes_iv = base64.b64decode(aes_iv_base64)
+        self.__aes_gcm = AESGCM(self.__aes_key)
 
-    def __encrypt_data_aes(self, data):
+    def __encrypt_data_aes(self, data, associated_data: Optional[bytes]) -> Tuple[bytes, bytes]:
         """
-        Encrypts data using AES.
+        Encrypts and authenticates data using AES-GCM.
+        The nonce is the direction field followed by a 64-bit counter. The session key is shared by one server and
+        one client only, the direction field separates them and the counter is never reset, so a nonce never repeats
+        for a key and costs no call to the OS random generator per packet.
+        next() on itertools.count is atomic, so the executor threads can encrypt concurrently.
 
         Args:
             data: The plaintext data to encrypt.
+            associated_data: Unencrypted data authenticated together with the ciphertext, or None.
 
         Returns:
-            The encrypted data.
+            The nonce and the ciphertext followed by the authentication tag.
         """
-        padder = sym_padding.PKCS7(128).padder()
-        padded_data = padder.update(data) + padder.finalize()
+        nonce = self.__NONCE_STRUCT.pack(self.__nonce_direction, next(self.__nonce_counter))
 
-        encryptor = Cipher(algorithms.AES(self.__aes_key), modes.CBC(self.__aes_iv)).encryptor()
+        return nonce, self.__aes_gcm.encrypt(nonce, data, associated_data)
 
-        return encryptor.update(padded_data) + encryptor.finalize()
-
-    def __decrypt_data_aes(self, encrypted_data):
+    def __decrypt_data_aes(self, encrypted_data, associated_data: Optional[bytes]):
         """
-        Decrypts data using AES.
+        Decrypts data using AES-GCM and verifies its authentication tag.
 
         Args:
-            encrypted_data: The encrypted data to decrypt.
+            encrypted_data: The nonce followed by the ciphertext and the authentication tag.
+            associated_data: Unencrypted data authenticated together with the ciphertext, or None.
 
         Returns:
             The decrypted plaintext data.
         """
-        decryptor = Cipher(algorithms.AES(self.__aes_key), modes.CBC(self.__aes_iv)).decryptor()
-        padded_data = decryptor.update(encrypted_data) + decryptor.finalize()
-
-        unpadder = sym_padding.PKCS7(128).unpadder()
+        nonce = encrypted_data[:self.__AES_GCM_NONCE_SIZE]
 
-        return unpadder.update(padded_data) + unpadder.finalize()
+        return self.__aes_gcm.decrypt(nonce, encrypted_data[self.__AES_GCM_NONCE_SIZE:], associated_data)
 
     @staticmethod
-    def __calculate_hash_to_data(data: bytes) -> bytes:
+    def __calculate_hash_to_data(data: bytes, associated_data: Optional[bytes]) -> Tuple[bytes, bytes]:
         hasher = hashlib.sha256()
+        if associated_data is not None:
+            hasher.update(associated_data)
         hasher.update(data)
         data_hash = hasher.digest()
-        message = data_hash + data
 
-        return message
+        return data_hash, data
 
     @staticmethod
-    def __compare_hash_and_get_data(message: bytes) -> bytes:
+    def __compare_hash_and_get_data(message: bytes, associated_data: Optional[bytes]) -> bytes:
         received_hash = message[:32]
         data = message[32:]
         hasher = hashlib.sha256()
+        if associated_data is not None:
+            hasher.update(associated_data)
         hasher.update(data)
         calculated_hash = hasher.digest()
 
         if received_hash != calculated_hash:
-            logging.error("Data integrity check failed")
-            raise ValueError
+            raise ValueError("Data integrity check failed")
         else:
             return data
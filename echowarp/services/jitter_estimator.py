@@ -0,0 +1,88 @@
+import math
+from typing import Optional
+
+
+class JitterEstimator:
+    """
+    Estimates the jitter of incoming audio packets from their arrival times and derives how many packets
+    the client should buffer before playback starts.
+
+    The mean interval and the jitter are smoothed with the 1/16 gain used for interarrival jitter in RFC 3550.
+
+    Attributes:
+        __min_prebuffer_packets (int): Lower bound of packets buffered before playback.
+        __max_prebuffer_packets (int): Upper bound of packets buffered before playback.
+        __last_arrival_ns (Optional[int]): Arrival time of the previous packet in nanoseconds.
+        __mean_interval_ns (float): Smoothed interval between packets in nanoseconds.
+        __jitter_ns (float): Smoothed deviation of packet intervals from the mean interval in nanoseconds.
+    """
+    __min_prebuffer_packets: int
+    __max_prebuffer_packets: int
+    __last_arrival_ns: Optional[int]
+    __mean_interval_ns: float
+    __jitter_ns: float
+
+    __SMOOTHING_GAIN = 1 / 16
+    __MAX_INTERVAL_NS = 1_000_000_000
+
+    def __init__(self, min_prebuffer_packets: int, max_prebuffer_packets: int):
+        """
+        Initializes the estimator.
+
+        Args:
+            min_prebuffer_packets (int): Packets buffered before playback on a stable network.
+            max_prebuffer_packets (int): Maximum packets buffered before playback on a jittery network.
+        """
+        self.__min_prebuffer_packets = min_prebuffer_packets
+        self.__max_prebuffer_packets = max(min_prebuffer_packets, max_prebuffer_packets)
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets the packet history, e.g. after the stream was paused.
+        """
+        self.__last_arrival_ns = None
+        self.__mean_interval_ns = 0.0
+        self.__jitter_ns = 0.0
+
+    def update(self, arrival_ns: int):
+        """
+        Adds the arrival time of a packet to the estimate.
+        Intervals longer than a second are treated as a pause of the stream and are not counted.
+
+        Args:
+            arrival_ns (int): Arrival time of the packet in nanoseconds.
+        """
+        last_arrival_ns = self.__last_arrival_ns
+        self.__last_arrival_ns = arrival_ns
+
+        if last_arrival_ns is None:
+            return
+
+        interval_ns = arrival_ns - last_arrival_ns
+        if interval_ns < 0 or interval_ns > self.__MAX_INTERVAL_NS:
+            return
+
+        if self.__mean_interval_ns == 0.0:
+            self.__mean_interval_ns = float(interval_ns)
+            return
+
+        self.__mean_interval_ns += (interval_ns - self.__mean_interval_ns) * self.__SMOOTHING_GAIN
+        self.__jitter_ns += (abs(interval_ns - self.__mean_interval_ns) - self.__jitter_ns) * self.__SMOOTHING_GAIN
+
+    def get_jitter_ms(self) -> float:
+        return self.__jitter_ns / 1_000_000
+
+    def get_prebuffer_packets(self) -> int:
+        """
+        Returns how many packets to buffer before playback starts, enough to cover twice the current jitter.
+
+        Returns:
+            int: Packets to buffer, between the configured minimum and maximum.
+        """
+        if self.__mean_interval_ns == 0.0:
+            return self.__min_prebuffer_packets
+
+        prebuffer_packets = 1 + math.ceil(2 * self.__jitter_ns / self.__mean_interval_ns)
+
+        return min(max(prebuffer_packets, self.__min_prebuffer_packets), self.__max_prebuffer_packets)
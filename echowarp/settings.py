@@ -17,7 +17,8 @@ class Settings:
         audio_device (AudioDevice): The audio device configuration.
         password (Optional[str]): The password for authentication.
         crypto_manager (Optional[CryptoManager]): Manages cryptographic operations, optional for non-secure mode.
-        executor (ThreadPoolExecutor): Executor for managing concurrent tasks.
+        executor (Optional[ThreadPoolExecutor]): Executor for sending audio packets, created only in server mode
+        with more than one worker.
         is_error_log (bool): Indicates if error logging is enabled.
         socket_buffer_size (int): The buffer size for the socket.
     """
@@ -28,7 +29,7 @@ class Settings:
     audio_device: AudioDevice
     password: Optional[str]
     crypto_manager: Optional[CryptoManager]
-    executor: ThreadPoolExecutor
+    executor: Optional[ThreadPoolExecutor]
     is_error_log: bool
     socket_buffer_size: int
 
@@ -45,7 +46,7 @@ class Settings:
             reconnect_attempt (int): Number of reconnect attempts before considering a disconnect.
             is_ssl (bool): Enables SSL for secure communication.
             is_integrity_control (bool): Enables integrity control using hashing.
-            workers (int): Number of worker threads for handling concurrent operations.
+            workers (int): Number of worker threads for handling concurrent operations (server mode only).
             audio_device (AudioDevice): Configured audio device.
             password (Optional[str]): Password for authentication.
             is_error_log (bool): Indicates if error logging is enabled.
@@ -58,6 +59,6 @@ class Settings:
         self.audio_device = audio_device
         self.password = password
         self.crypto_manager = CryptoManager(self.is_server, is_integrity_control, is_ssl)
-        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.executor = ThreadPoolExecutor(max_workers=workers) if is_server and workers > 1 else None
         self.is_error_log = is_error_log
         self.socket_buffer_size = socket_buffer_size
@@ -23,6 +23,11 @@ class ArgsParser:
                 argparse.ArgumentError: If there are issues with the provided arguments, such as missing required arguments
                                         or invalid values.
         """
+        default_port = DefaultValuesAndOptions.get_default_port()
+        default_socket_buffer_size = DefaultValuesAndOptions.get_socket_buffer_size_options_data().default_value
+        default_device_encoding_names = DefaultValuesAndOptions.get_encoding_charset_options_data().default_value
+        default_reconnect_attempt = DefaultValuesAndOptions.get_default_reconnect_attempt()
+
         parser = argparse.ArgumentParser(description="EchoWarp Audio Streamer")
 
         parser.add_argument("-c", "--client", action='store_false',
@@ -33,15 +38,10 @@ class ArgsParser:
             help=f"Use output audio device.{os.linesep}"
                  f"(default={DefaultValuesAndOptions.get_audio_device_type_options_data().default_descr})"
         )
-        parser.add_argument("-u", "--udp_port", type=int, default=DefaultValuesAndOptions.get_default_port(),
-                            help=f"UDP port for audio streaming. "
-                                 f"(default={DefaultValuesAndOptions.get_default_port()})")
-        parser.add_argument(
-            "-b", "--socket_buffer_size", type=int,
-            default=DefaultValuesAndOptions.get_socket_buffer_size_options_data().default_value,
-            help=f"Size of socket buffer. "
-                 f"(default={DefaultValuesAndOptions.get_socket_buffer_size_options_data().default_value})"
-        )
+        parser.add_argument("-u", "--udp_port", type=int, default=default_port,
+                            help=f"UDP port for audio streaming. (default={default_port})")
+        parser.add_argument("-b", "--socket_buffer_size", type=int, default=default_socket_buffer_size,
+                            help=f"Size of socket buffer. (default={default_socket_buffer_size})")
         parser.add_argument("-d", "--device_id", type=int,
                             help="Specify the device ID to bypass interactive selection.")
         parser.add_argument("-p", "--password", type=str, help="Password, if needed.")
@@ -49,19 +49,18 @@ class ArgsParser:
                                                                   "(Ignoring other args, if they added).")
         parser.add_argument("-e", "--device_encoding_names", type=str,
                             help=f"Charset encoding for audio device. "
-                                 f"(default=preferred system encoding - "
-                                 f"{DefaultValuesAndOptions.get_encoding_charset_options_data().default_value})",
-                            default=DefaultValuesAndOptions.get_encoding_charset_options_data().default_value)
+                                 f"(default=preferred system encoding - {default_device_encoding_names})",
+                            default=default_device_encoding_names)
         parser.add_argument("--ignore_device_encoding_names", action='store_true',
                             help="Ignoring device names encoding.")
 
         parser.add_argument("-l", "--is_error_log", action='store_true', help="Init error file logger.")
         parser.add_argument("-r", "--reconnect", type=int,
-                            default=DefaultValuesAndOptions.get_default_reconnect_attempt(),
+                            default=default_reconnect_attempt,
                             help=f"The number of failed connections in client mode before closing the application. "
                                  f"The number of failed client authorization attempts in server mode "
                                  f"before banning the client. (0 = infinite). "
-                                 f"(default={DefaultValuesAndOptions.get_default_reconnect_attempt()})")
+                                 f"(default={default_reconnect_attempt})")
 
         parser.add_argument("-s", "--save_config", type=str, help="Save config file from selected args "
                                                                   "(Ignored default values)")
@@ -88,7 +87,7 @@ class ArgsParser:
             Logger.init_warning_logger()
 
         if args.config_file is not None:
-            return ArgsParser.__load_from_config(args.config_file)
+            return ConfigParser.get_settings_from_config(args.config_file)
 
         if not args.client:
             if any([args.ssl, args.integrity_control]) and args.workers != 1:
@@ -100,7 +99,7 @@ class ArgsParser:
                 parser.error("The --server_address argument is only valid in client mode.")
 
         if args.ignore_device_encoding_names:
-            args.device_encoding_names = DefaultValuesAndOptions.get_encoding_charset_options_data().default_value
+            args.device_encoding_names = default_device_encoding_names
 
         audio_device = AudioDevice(args.output,
                                    args.device_id,
@@ -125,25 +124,3 @@ class ArgsParser:
             ConfigParser(filename=args.save_config, settings=settings)
 
         return settings
-
-    @staticmethod
-    def __load_from_config(filepath: str) -> Settings:
-        configs = ConfigParser(filename=filepath)
-        audio_device = AudioDevice(configs.is_input_audio_device,
-                                   configs.device_id,
-                                   configs.ignore_device_encoding_names,
-                                   configs.device_encoding_names)
-
-        return Settings(
-            configs.is_server,
-            configs.udp_port,
-            configs.server_address,
-            configs.reconnect_attempt,
-            configs.is_ssl,
-            configs.is_integrity_control,
-            configs.workers,
-            audio_device,
-            configs.password,
-            configs.is_error_log,
-            configs.socket_buffer_size
-        )
@@ -1,5 +1,4 @@
 import json
-import locale
 import logging
 import os
 import sys
@@ -8,6 +7,7 @@ from typing import Optional, List, Dict, get_type_hints
 import configparser
 
 from echowarp.logging_config import Logger
+from echowarp.models.audio_device import AudioDevice
 from echowarp.models.default_values_and_options import DefaultValuesAndOptions
 from echowarp.settings import Settings
 
@@ -88,6 +88,37 @@ class ConfigParser:
         else:
             self.__load_config(filename)
 
+    @staticmethod
+    def get_settings_from_config(filepath: str) -> Settings:
+        """
+        Loads a config file and builds the audio device and settings described by it.
+
+        Args:
+            filepath (str): Path to the config file.
+
+        Returns:
+            Settings: Settings populated with values from the config file and defaults for missing keys.
+        """
+        configs = ConfigParser(filename=filepath)
+        audio_device = AudioDevice(configs.is_input_audio_device,
+                                   configs.device_id,
+                                   configs.ignore_device_encoding_names,
+                                   configs.device_encoding_names)
+
+        return Settings(
+            configs.is_server,
+            configs.udp_port,
+            configs.server_address,
+            configs.reconnect_attempt,
+            configs.is_ssl,
+            configs.is_integrity_control,
+            configs.workers,
+            audio_device,
+            configs.password,
+            configs.is_error_log,
+            configs.socket_buffer_size
+        )
+
     def __save_config(self, filename: str, settings: Settings):
         save_dict = {}
 
@@ -137,10 +168,11 @@ class ConfigParser:
         if not filename.endswith('.conf'):
             filename += '.conf'
 
-        with open(filename, 'w', encoding=locale.getpreferredencoding()) as file:
-            file.write(f"[{DefaultValuesAndOptions.CONFIG_TITLE}]\n")
-            for key, value in save_dict.items():
-                file.write(f"{key}={value}\n")
+        config_lines = [f"[{DefaultValuesAndOptions.CONFIG_TITLE}]"]
+        config_lines.extend(f"{key}={value}" for key, value in save_dict.items())
+
+        with open(filename, 'w', encoding=DefaultValuesAndOptions.get_preferred_encoding()) as file:
+            file.write("\n".join(config_lines) + "\n")
 
         logging.info(f'Config file successfully saved in "{filename}"')
 
@@ -296,7 +328,7 @@ class ConfigParser:
     @staticmethod
     def get_file_str(file_path: str) -> str:
         try:
-            with open(file_path, 'r', encoding=locale.getpreferredencoding()) as file:
+            with open(file_path, 'r', encoding=DefaultValuesAndOptions.get_preferred_encoding()) as file:
                 file_str = file.read()
         except Exception as e:
             raise ValueError(f"Failed to decode config file: {e}")
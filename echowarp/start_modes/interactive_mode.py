@@ -1,5 +1,6 @@
 import itertools
 import os
+from typing import Iterable
 
 import logging
 
@@ -16,17 +17,17 @@ class NumberValidator:
         A custom validator for prompt_toolkit that ensures user input is a valid number within a specified range.
 
         Attributes:
-            valid_numbers (set): A set of numbers that are considered valid for input.
+            valid_numbers (frozenset): A set of numbers that are considered valid for input.
     """
 
-    def __init__(self, valid_numbers: list):
+    def __init__(self, valid_numbers: Iterable[int]):
         """
         Initializes the NumberValidator with the specified set of valid numbers.
 
         Args:
-            valid_numbers (list): The set of valid numbers.
+            valid_numbers (Iterable[int]): The valid numbers.
         """
-        self.valid_numbers = valid_numbers
+        self.valid_numbers = frozenset(valid_numbers)
 
     def validate(self, input_str: str):
         """
@@ -44,6 +45,27 @@ class NumberValidator:
             return True
 
 
+class IntValidator:
+    """
+        A validator that checks that user input is an integer, without relying on int() raising ValueError.
+    """
+
+    @staticmethod
+    def validate(input_str: str):
+        """
+        Validates the user input as an optionally signed integer.
+
+        Returns:
+            None if the input is empty, True if it is an integer, otherwise False.
+        """
+        if input_str == '':
+            return None
+
+        digits = input_str[1:] if input_str[0] in '+-' else input_str
+
+        return digits.isdecimal()
+
+
 class InteractiveSettings:
     """
     Handles the interactive configuration of EchoWarp settings through command line prompts.
@@ -78,7 +100,7 @@ class InteractiveSettings:
             )
 
             if is_load_config:
-                return InteractiveSettings.__get_settings_from_config(conf_files[0])
+                return ConfigParser.get_settings_from_config(conf_files[0])
         elif len(conf_files) > 1:
             config_files_num_list = [[value, i] for i, value in zip(itertools.count(), conf_files)]
             config_file_num = InteractiveSettings.__select_in_interactive_from_values(
@@ -93,11 +115,11 @@ class InteractiveSettings:
                 selected_file_name = config_files_num_list[config_file_num][0]
 
                 # noinspection PyTypeChecker
-                return InteractiveSettings.__get_settings_from_config(selected_file_name)
+                return ConfigParser.get_settings_from_config(selected_file_name)
         else:
             config_file_path = input("Input path to config file (empty field to skip): ")
             if config_file_path.strip() != '':
-                return InteractiveSettings.__get_settings_from_config(config_file_path.strip())
+                return ConfigParser.get_settings_from_config(config_file_path.strip())
 
         is_error_log = InteractiveSettings.__select_in_interactive_from_values(
             'error file logger switcher',
@@ -202,18 +224,14 @@ class InteractiveSettings:
         return str_input
 
     @staticmethod
-    def __get_not_null_int_input(descr: str) -> str:
-        int_input = ''
-        while type(int_input) is not int:
-            try:
-                int_input = input(f'Input {descr}: ').strip()
-                if int_input == '':
-                    raise Exception
-                int_input = int(int_input)
-            except Exception:
-                logging.error(f"Invalid {descr}: {int_input}")
+    def __get_not_null_int_input(descr: str) -> int:
+        while True:
+            str_input = input(f'Input {descr}: ').strip()
 
-        return int_input
+            if IntValidator.validate(str_input):
+                return int(str_input)
+
+            logging.error(f"Invalid {descr}: {str_input}")
 
     @staticmethod
     def __select_in_interactive_from_values(descr: str, options_data: OptionsData):
@@ -229,12 +247,12 @@ class InteractiveSettings:
         """
         options_dict = {index: opt for index, opt in enumerate(options_data.options, start=1)}
 
-        choices = os.linesep.join([f"{num}. {desc.option_descr}" for num, desc in options_dict.items()])
-        prompt_text = (f"Select id of {descr}:"
-                       f"{os.linesep + choices + os.linesep}"
-                       f"Empty field for default value (default={options_data.default_descr}): {os.linesep}")
+        choices = "\n".join(f"{num}. {desc.option_descr}" for num, desc in options_dict.items())
+        prompt_text = (f"Select id of {descr}:\n"
+                       f"{choices}\n"
+                       f"Empty field for default value (default={options_data.default_descr}): \n")
 
-        number_validator = NumberValidator(list(options_dict.keys()))
+        number_validator = NumberValidator(options_dict)
         while True:
             try:
                 choice = input(prompt_text)
@@ -248,7 +266,7 @@ class InteractiveSettings:
                     raise ValueError
             except ValueError:
                 logging.error(f"Invalid input, please try again.{os.linesep}"
-                              f"Valid input id's: {number_validator.valid_numbers}")
+                              f"Valid input id's: {sorted(number_validator.valid_numbers)}")
 
     @staticmethod
     def __input_in_interactive_int_value(default_value: int, descr: str) -> int:
@@ -263,31 +281,12 @@ class InteractiveSettings:
             int: The user-input value or the default value.
         """
         while True:
-            try:
-                value = input(f"Select {descr} (default={default_value}): ")
+            value = input(f"Select {descr} (default={default_value}): ").strip()
+            is_validating = IntValidator.validate(value)
 
-                return int(value) if value else default_value
-            except ValueError as ve:
-                logging.error(f"Invalid input, please enter a valid integer: {ve}")
+            if is_validating is None:
+                return default_value
+            elif is_validating:
+                return int(value)
 
-    @staticmethod
-    def __get_settings_from_config(filepath: str) -> Settings:
-        configs = ConfigParser(filepath)
-        audio_device = AudioDevice(configs.is_input_audio_device,
-                                   configs.device_id,
-                                   configs.ignore_device_encoding_names,
-                                   configs.device_encoding_names)
-
-        return Settings(
-            configs.is_server,
-            configs.udp_port,
-            configs.server_address,
-            configs.reconnect_attempt,
-            configs.is_ssl,
-            configs.is_integrity_control,
-            configs.workers,
-            audio_device,
-            configs.password,
-            configs.is_error_log,
-            configs.socket_buffer_size
-        )
+            logging.error(f"Invalid input, please enter a valid integer: {value}")
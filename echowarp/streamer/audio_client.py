@@ -1,11 +1,20 @@
+import gc
+import heapq
+import selectors
+import socket
+import struct
 import threading
-from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import List, Tuple, Optional
 
 import pyaudio
 import logging
 
 from echowarp.auth_and_heartbeat.transport_client import TransportClient
 from echowarp.models.audio_device import AudioDevice
+from echowarp.models.default_values_and_options import DefaultValuesAndOptions
+from echowarp.services.cpu_affinity import CpuAffinity
+from echowarp.services.jitter_estimator import JitterEstimator
 from echowarp.settings import Settings
 
 
@@ -16,10 +25,54 @@ class ClientStreamReceiver(TransportClient):
         Attributes:
             _udp_port (int): The port number used for receiving UDP audio streams.
             _audio_device (AudioDevice): Audio device configuration for output.
-            _executor (ThreadPoolExecutor): Executor for asynchronous task handling.
+            __playback_buffer (bytearray): FIFO of decoded audio, filled by the receive loop
+            and drained by the PortAudio stream callback.
+            __playback_lock (threading.Lock): Guards the playback buffer and the playback state.
+            __is_playback_started (bool): False while the playback buffer is filling up before (re)starting playback.
+            __prebuffer_size (int): Bytes to buffer before playback starts, derived from the jitter estimate.
+            __max_buffer_size (int): Bytes above which the oldest buffered audio is dropped to bound latency.
+            __frame_size (int): Bytes per audio frame across all channels.
+            __underruns (int): Number of times playback ran out of buffered audio.
+            __jitter_estimator (JitterEstimator): Estimates packet jitter and the number of packets to prebuffer.
+            __is_recvmsg (bool): True if the socket supports recvmsg_into, which reports truncated packets.
+            __truncated_packets (int): Number of packets dropped because they did not fit into the socket buffer.
+            __rejected_packets (int): Number of packets dropped because they failed decryption or integrity check.
+            __reorder_heap (List[Tuple[int, bytes]]): Min-heap of decoded packets waiting for missing earlier packets,
+            keyed by unwrapped sequence number.
+            __next_sequence_number (Optional[int]): Unwrapped sequence number of the next packet to play,
+            None until the first packet arrives.
+            __lost_packets (int): Number of packets skipped because they did not arrive within the reorder window.
+            __late_packets (int): Number of packets dropped because they arrived after later packets were played.
+            __is_new_session (bool): Set when streaming (re)starts after authentication, so the receiving thread
+            resets the reorder window and the jitter estimate before handling packets of the new session.
+            __stream (pyaudio.Stream): Audio stream, opened stopped and started when receiving begins.
     """
     _audio_device: AudioDevice
-    _executor: ThreadPoolExecutor
+    __playback_buffer: bytearray
+    __playback_lock: threading.Lock
+    __is_playback_started: bool
+    __prebuffer_size: int
+    __max_buffer_size: int
+    __frame_size: int
+    __underruns: int
+    __jitter_estimator: JitterEstimator
+    __is_recvmsg: bool
+    __truncated_packets: int
+    __rejected_packets: int
+    __reorder_heap: List[Tuple[int, bytes]]
+    __next_sequence_number: Optional[int]
+    __lost_packets: int
+    __late_packets: int
+    __is_new_session: bool
+    __stream: pyaudio.Stream
+
+    __TIMESPEC_STRUCT = struct.Struct('@ll')
+    __MAX_PACKETS_PER_WAKEUP = 64
+    __WSAEMSGSIZE = 10040
+    __SEQUENCE_STRUCT = struct.Struct('!H')
+    __SEQUENCE_MODULO = 1 << 16
+    __REORDER_WINDOW_PACKETS = 4
+    __MAX_LATE_PACKETS = 256
 
     def __init__(self, settings: Settings, stop_util_event: threading.Event(), stop_stream_event: threading.Event()):
         """
@@ -30,7 +83,24 @@ class ClientStreamReceiver(TransportClient):
         """
         super().__init__(settings, stop_util_event, stop_stream_event)
         self._audio_device = settings.audio_device
-        self._executor = settings.executor
+        self.__playback_buffer = bytearray()
+        self.__playback_lock = threading.Lock()
+        self.__is_playback_started = False
+        self.__prebuffer_size = 0
+        self.__max_buffer_size = 0
+        self.__frame_size = self._audio_device.channels * 2
+        self.__underruns = 0
+        self.__jitter_estimator = JitterEstimator(DefaultValuesAndOptions.get_prebuffer_packets(),
+                                                  DefaultValuesAndOptions.get_max_prebuffer_packets())
+        self.__is_recvmsg = hasattr(self._udp_socket, 'recvmsg_into')
+        self.__truncated_packets = 0
+        self.__rejected_packets = 0
+        self.__reorder_heap = []
+        self.__next_sequence_number = None
+        self.__lost_packets = 0
+        self.__late_packets = 0
+        self.__is_new_session = True
+        self.__stream = self._audio_device.open_stream(start=False, stream_callback=self.__playback_callback)
 
     def receive_audio_and_decode(self):
         """
@@ -38,50 +108,274 @@ class ClientStreamReceiver(TransportClient):
         and then playing it back using the configured audio device.
 
         This method handles continuous audio streaming until a stop event is triggered.
+        The loop waits for UDP data and for the shutdown wakeup socket in one selector call,
+        so shutdown interrupts the wait immediately.
+        Packets are decoded in the receiving thread in arrival order and queued in the playback buffer,
+        which PortAudio drains from its own thread through the stream callback.
+        Arrival times, taken from the kernel where possible, feed the jitter estimate that sizes the prebuffer.
+        Packets larger than the socket buffer are dropped instead of being played truncated.
+        After each wakeup the non-blocking socket is drained of all queued packets, up to a limit,
+        before waiting again, so a burst of packets costs one selector call instead of one per packet.
+        Objects allocated before streaming are frozen, so garbage collections during streaming do not scan them.
         """
-        if self._audio_device.is_input_device:
-            stream = self._audio_device.py_audio.open(
-                format=pyaudio.paInt16,
-                channels=self._audio_device.channels,
-                rate=self._audio_device.sample_rate,
-                input=True,
-                input_device_index=self._audio_device.device_index
-            )
-        else:
-            stream = self._audio_device.py_audio.open(
-                format=pyaudio.paInt16,
-                channels=self._audio_device.channels,
-                rate=self._audio_device.sample_rate,
-                output=True,
-                output_device_index=self._audio_device.device_index
-            )
+        CpuAffinity.pin_current_thread()
+
+        stream = self.__stream
+        stream.start_stream()
+
+        selector = selectors.DefaultSelector()
+        selector.register(self._udp_socket, selectors.EVENT_READ)
+        selector.register(self._wakeup_reader_socket, selectors.EVENT_READ)
+        timeout = DefaultValuesAndOptions.get_timeout()
+        receive_buffer = memoryview(bytearray(self._socket_buffer_size))
+        ancillary_size = socket.CMSG_SPACE(self.__TIMESPEC_STRUCT.size) if self._is_udp_kernel_timestamps else 0
+
+        udp_socket = self._udp_socket
+        is_stop_util = self._stop_util_event.is_set
+        wait_stream = self._stop_stream_event.wait
+        select = selector.select
+        receive_packet = self.__receive_packet
+        decode_and_play = self.__decode_and_play
+        max_packets_per_wakeup = self.__MAX_PACKETS_PER_WAKEUP
+        udp_socket.setblocking(False)
 
+        gc.freeze()
         self._print_udp_listener_and_start_stream()
         try:
-            while not self._stop_util_event.is_set():
-                try:
-                    data, _ = self._udp_socket.recvfrom(self._socket_buffer_size)
-                    self._executor.submit(self.__decode_and_play, data, stream)
-                except Exception:
-                    pass
-
-                self._stop_stream_event.wait()
+            while not is_stop_util():
+                if self.__is_new_session:
+                    self.__reset_session_state()
+
+                for key, _ in select(timeout):
+                    if key.fileobj is not udp_socket:
+                        continue
+
+                    for _ in range(max_packets_per_wakeup):
+                        try:
+                            received_size = receive_packet(receive_buffer, ancillary_size)
+                        except OSError:
+                            break
+
+                        if received_size is None:
+                            continue
+
+                        try:
+                            decode_and_play(bytes(receive_buffer[:received_size]))
+                        except ValueError as e:
+                            self.__rejected_packets += 1
+
+                            if self.__rejected_packets == 1:
+                                logging.warning(f"Rejected audio packet: {e}")
+                        except Exception:
+                            pass
+
+                wait_stream()
         finally:
-            self._executor.shutdown()
+            selector.close()
             stream.stop_stream()
             stream.close()
 
-            self._audio_device.py_audio.terminate()
+            if self.__truncated_packets > 0:
+                logging.warning(f"Dropped {self.__truncated_packets} truncated audio packets")
+
+            if self.__rejected_packets > 0:
+                logging.warning(f"Rejected {self.__rejected_packets} audio packets that failed decryption "
+                                f"or integrity check")
+
+            if self.__lost_packets > 0 or self.__late_packets > 0:
+                logging.warning(f"Audio packets lost: {self.__lost_packets}, arrived too late: {self.__late_packets}")
+
+            if self.__underruns > 0:
+                logging.warning(f"Playback ran out of buffered audio {self.__underruns} times")
 
-            logging.info("UDP listening finished...")
+            logging.info(f"UDP listening finished. "
+                         f"Estimated network jitter: {self.__jitter_estimator.get_jitter_ms():.2f} ms")
+
+    def __receive_packet(self, receive_buffer: memoryview, ancillary_size: int) -> Optional[int]:
+        """
+        Receives one UDP packet into the buffer and adds its arrival time to the jitter estimate.
+
+        Args:
+            receive_buffer (memoryview): Preallocated buffer for the packet.
+            ancillary_size (int): Size of the ancillary data buffer for the kernel timestamp.
+
+        Returns:
+            Optional[int]: Size of the received packet, or None if the packet did not fit into the buffer.
+        """
+        if self.__is_recvmsg:
+            received_size, ancillary_data, flags, _ = self._udp_socket.recvmsg_into([receive_buffer], ancillary_size)
+            is_truncated = bool(flags & socket.MSG_TRUNC)
+            arrival_ns = self.__get_kernel_timestamp_ns(ancillary_data)
+        else:
+            try:
+                received_size = self._udp_socket.recv_into(receive_buffer)
+                is_truncated = False
+            except OSError as e:
+                if getattr(e, 'winerror', None) != self.__WSAEMSGSIZE:
+                    raise
+
+                received_size = len(receive_buffer)
+                is_truncated = True
+
+            arrival_ns = time.time_ns()
+
+        self.__jitter_estimator.update(arrival_ns)
+
+        if is_truncated:
+            self.__truncated_packets += 1
+
+            if self.__truncated_packets == 1:
+                logging.warning(f"Received audio packet larger than socket buffer size ({len(receive_buffer)} bytes), "
+                                f"packet dropped. Increase socket buffer size to match the server.")
+
+            return None
+
+        return received_size
+
+    @staticmethod
+    def __get_kernel_timestamp_ns(ancillary_data: List[Tuple[int, int, bytes]]) -> int:
+        for level, message_type, data in ancillary_data:
+            if (level == socket.SOL_SOCKET and message_type == ClientStreamReceiver._SO_TIMESTAMPNS
+                    and len(data) >= ClientStreamReceiver.__TIMESPEC_STRUCT.size):
+                seconds, nanoseconds = ClientStreamReceiver.__TIMESPEC_STRUCT.unpack_from(data)
+
+                return seconds * 1_000_000_000 + nanoseconds
+
+        return time.time_ns()
+
+    def _print_udp_listener_and_start_stream(self):
+        self.__is_new_session = True
+        super()._print_udp_listener_and_start_stream()
+
+    def __reset_session_state(self):
+        """
+        Forgets the packet order and the jitter history of the previous session,
+        since a restarted server numbers its packets from zero again.
+        """
+        self.__is_new_session = False
+        self.__reorder_heap.clear()
+        self.__next_sequence_number = None
+        self.__jitter_estimator.reset()
 
-    def __decode_and_play(self, data, stream):
+    def __decode_and_play(self, data):
         """
-        Decodes the received encrypted audio data and plays it back.
+        Decodes the received encrypted audio data and queues it for playback in sequence order.
+        The sequence number header is verified together with the audio data, so a tampered header is rejected.
 
         Args:
-            data (bytes): Encrypted audio data.
-            stream (pyaudio.Stream): PyAudio stream for audio playback.
+            data (bytes): Sequence number header followed by encrypted audio data.
         """
-        data = self._crypto_manager.decrypt_aes_and_verify_data(data)
-        stream.write(data)
+        sequence_size = self.__SEQUENCE_STRUCT.size
+        sequence_header = data[:sequence_size]
+        sequence_number, = self.__SEQUENCE_STRUCT.unpack(sequence_header)
+        data = self._crypto_manager.decrypt_aes_and_verify_data(data[sequence_size:], sequence_header)
+
+        for packet in self.__reorder_packet(sequence_number, data):
+            self.__queue_for_playback(packet)
+
+    def __reorder_packet(self, sequence_number: int, data: bytes) -> List[bytes]:
+        """
+        Puts a packet into the reorder window and returns the packets that are ready to play, in sequence order.
+        A packet is held back only while an earlier packet is missing and the window is not full;
+        when the window fills up, the missing packets are skipped. Duplicates and packets older than
+        the last played one are dropped. A packet far behind the expected sequence means the server restarted
+        its sequence, so the window is reset.
+
+        Args:
+            sequence_number (int): 16-bit sequence number of the packet.
+            data (bytes): Decoded audio data.
+
+        Returns:
+            List[bytes]: Audio data ready for playback.
+        """
+        next_sequence_number = self.__next_sequence_number
+
+        if next_sequence_number is None:
+            next_sequence_number = sequence_number
+        else:
+            distance = (sequence_number - next_sequence_number) % self.__SEQUENCE_MODULO
+
+            if distance < self.__SEQUENCE_MODULO // 2:
+                sequence_number = next_sequence_number + distance
+            elif self.__SEQUENCE_MODULO - distance <= self.__MAX_LATE_PACKETS:
+                self.__late_packets += 1
+                return []
+            else:
+                self.__reorder_heap.clear()
+                next_sequence_number = sequence_number
+
+        reorder_heap = self.__reorder_heap
+        heapq.heappush(reorder_heap, (sequence_number, data))
+
+        ready_packets = []
+        while reorder_heap and (reorder_heap[0][0] <= next_sequence_number
+                                or len(reorder_heap) > self.__REORDER_WINDOW_PACKETS):
+            sequence_number, data = heapq.heappop(reorder_heap)
+
+            if sequence_number < next_sequence_number:
+                continue
+
+            self.__lost_packets += sequence_number - next_sequence_number
+            next_sequence_number = sequence_number + 1
+            ready_packets.append(data)
+
+        self.__next_sequence_number = next_sequence_number
+
+        return ready_packets
+
+    def __queue_for_playback(self, data: bytes):
+        """
+        Appends decoded audio to the playback buffer.
+        If the playback buffer grows beyond its limit, the oldest whole frames are dropped to bound latency.
+
+        Args:
+            data (bytes): Decoded audio data.
+        """
+        packet_size = len(data)
+
+        with self.__playback_lock:
+            self.__prebuffer_size = self.__jitter_estimator.get_prebuffer_packets() * packet_size
+            self.__max_buffer_size = 2 * DefaultValuesAndOptions.get_max_prebuffer_packets() * packet_size
+            self.__playback_buffer += data
+
+            overflow_size = len(self.__playback_buffer) - self.__max_buffer_size
+            if overflow_size > 0:
+                drop_size = -(-overflow_size // self.__frame_size) * self.__frame_size
+                del self.__playback_buffer[:drop_size]
+
+    def __playback_callback(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio stream callback, called from the audio thread whenever the device needs more audio.
+        Plays silence until the prebuffer is filled, then takes audio from the playback buffer.
+        If the buffer runs dry, the remainder is padded with silence and the buffer is filled up again.
+
+        Args:
+            in_data: Unused for output streams.
+            frame_count (int): Number of frames the device requests.
+            time_info (dict): Stream timing information.
+            status (int): PortAudio status flags.
+
+        Returns:
+            Tuple[bytes, int]: Audio for the device and the flag to continue the stream.
+        """
+        requested_size = frame_count * self.__frame_size
+
+        with self.__playback_lock:
+            buffered_size = len(self.__playback_buffer)
+
+            if not self.__is_playback_started:
+                if buffered_size == 0 or buffered_size < self.__prebuffer_size:
+                    return bytes(requested_size), pyaudio.paContinue
+
+                self.__is_playback_started = True
+
+            if buffered_size >= requested_size:
+                out_data = bytes(self.__playback_buffer[:requested_size])
+                del self.__playback_buffer[:requested_size]
+            else:
+                out_data = bytes(self.__playback_buffer) + bytes(requested_size - buffered_size)
+                self.__playback_buffer.clear()
+                self.__is_playback_started = False
+                self.__underruns += 1
+
+        return out_data, pyaudio.paContinue
@@ -1,12 +1,20 @@
+import gc
+import itertools
+import queue
+import struct
 import threading
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
 import pyaudio
 import logging
 
 from echowarp.auth_and_heartbeat.transport_server import TransportServer
+from echowarp.services.cpu_affinity import CpuAffinity
 from echowarp.services.crypto_manager import CryptoManager
 from echowarp.models.audio_device import AudioDevice
+from echowarp.models.default_values_and_options import DefaultValuesAndOptions
 from echowarp.settings import Settings
 
 
@@ -21,10 +29,31 @@ class ServerStreamer(TransportServer):
         _stop_util_event (threading.Event): Event to signal util to stop.
         _stop_stream_event (threading.Event): Event to signal stream to stop.
         _crypto_manager (CryptoManager): Manager for cryptographic operations.
-        _executor (Executor): Executor for asynchronous task execution.
+        _executor (Optional[ThreadPoolExecutor]): Executor for sending packets, None to send on the streaming thread.
+        _dropped_packets (int): Count of audio packets dropped because the socket send buffer was full.
+        __dropped_packets_lock (threading.Lock): Guards the dropped packets count, updated from executor workers.
+        _frames_per_buffer (int): Audio frames captured and sent per packet, 20 ms at the device sample rate
+        or less if such a packet would not fit into the socket buffer.
+        _capture_queue (queue.Queue): Bounded queue of captured buffers, filled by the PortAudio stream callback.
+        _dropped_captured_buffers (int): Count of captured buffers dropped because the capture queue was full.
+        __is_sendmsg (bool): True if the UDP socket supports scatter-gather sendmsg (not on Windows).
+        __sequence_numbers (itertools.count): Counter of captured buffers, sent as a 16-bit sequence number header
+        so the client can restore capture order.
+        _stream (pyaudio.Stream): Audio stream, opened stopped and started when streaming begins.
     """
     _audio_device: AudioDevice
-    _executor: ThreadPoolExecutor
+    _executor: Optional[ThreadPoolExecutor]
+    _dropped_packets: int
+    __dropped_packets_lock: threading.Lock
+    _frames_per_buffer: int
+    _capture_queue: queue.Queue
+    _dropped_captured_buffers: int
+    __is_sendmsg: bool
+    __sequence_numbers: itertools.count
+
+    __SEQUENCE_STRUCT = struct.Struct('!H')
+    __SEQUENCE_MASK = 0xFFFF
+    _stream: pyaudio.Stream
 
     def __init__(self, settings: Settings, stop_util_event: threading.Event(), stop_stream_event: threading.Event()):
         """
@@ -36,56 +65,133 @@ class ServerStreamer(TransportServer):
         super().__init__(settings, stop_util_event, stop_stream_event)
         self._audio_device = settings.audio_device
         self._executor = settings.executor
+        self._dropped_packets = 0
+        self.__dropped_packets_lock = threading.Lock()
+        self._frames_per_buffer = DefaultValuesAndOptions.get_frames_per_buffer(
+            self._audio_device.sample_rate, self._audio_device.channels, self._socket_buffer_size)
+        self._capture_queue = queue.Queue(maxsize=DefaultValuesAndOptions.get_capture_queue_size())
+        self._dropped_captured_buffers = 0
+        self.__is_sendmsg = hasattr(self._udp_socket, 'sendmsg')
+        self.__sequence_numbers = itertools.count()
+        self._stream = self._audio_device.open_stream(self._frames_per_buffer, start=False,
+                                                      stream_callback=self.__capture_callback)
 
     def encode_audio_and_send_to_client(self):
         """
         Captures audio from the selected device, encodes it, encrypts, and sends it to the client over UDP.
         This method continuously captures and sends audio until a stop event is triggered.
+        PortAudio captures in callback mode and queues buffers from its own thread; this loop takes them off the queue.
+        While streaming is paused, captured audio is discarded, and buffers queued before the pause are drained
+        on resume, so a resumed stream starts with fresh audio.
+        With a single worker, packets are encrypted and sent inline, which keeps their order and avoids a Future
+        and a thread handoff per packet. Buffers are numbered here, in capture order, before they are handed
+        to a worker, so the client can restore that order even if workers send them out of order.
+        Objects allocated before streaming are frozen, so garbage collections during streaming do not scan them.
         """
-        if self._audio_device.is_input_device:
-            stream = self._audio_device.py_audio.open(
-                format=pyaudio.paInt16,
-                channels=self._audio_device.channels,
-                rate=self._audio_device.sample_rate,
-                input=True,
-                input_device_index=self._audio_device.device_index,
-                frames_per_buffer=1024
-            )
-        else:
-            stream = self._audio_device.py_audio.open(
-                format=pyaudio.paInt16,
-                channels=self._audio_device.channels,
-                rate=self._audio_device.sample_rate,
-                output=True,
-                output_device_index=self._audio_device.device_index,
-                frames_per_buffer=1024
-            )
+        CpuAffinity.pin_current_thread()
+
+        stream = self._stream
+        stream.start_stream()
+
+        is_stop_util = self._stop_util_event.is_set
+        is_streaming = self._stop_stream_event.is_set
+        wait_stream = self._stop_stream_event.wait
+        get_captured = self._capture_queue.get
+        timeout = DefaultValuesAndOptions.get_timeout()
+        sequence_numbers = self.__sequence_numbers
+        pack_sequence_header = self.__SEQUENCE_STRUCT.pack
+        sequence_mask = self.__SEQUENCE_MASK
+        send_stream_to_client = self.__send_stream_to_client
+        if self._executor is not None:
+            send_stream_to_client = partial(self._executor.submit, send_stream_to_client)
 
+        gc.freeze()
         self._print_udp_listener_and_start_stream()
         try:
-            while not self._stop_util_event.is_set():
+            while not is_stop_util():
+                if not is_streaming():
+                    wait_stream()
+                    self.__drain_capture_queue()
+                    continue
+
                 try:
-                    data = stream.read(1024, exception_on_overflow=False)
-                    self._executor.submit(self.__send_stream_to_client, data)
+                    data = get_captured(timeout=timeout)
+                    send_stream_to_client(data, pack_sequence_header(next(sequence_numbers) & sequence_mask))
                 except Exception:
                     pass
-
-                self._stop_stream_event.wait()
         finally:
-            self._executor.shutdown()
+            if self._executor is not None:
+                self._executor.shutdown()
             stream.stop_stream()
             stream.close()
 
-            self._audio_device.py_audio.terminate()
+            if self._dropped_packets > 0:
+                logging.warning(f"Dropped {self._dropped_packets} audio packets due to full socket send buffer")
+
+            if self._dropped_captured_buffers > 0:
+                logging.warning(f"Dropped {self._dropped_captured_buffers} captured audio buffers "
+                                f"due to full capture queue")
 
             logging.info("UDP streaming finished...")
 
-    def __send_stream_to_client(self, data):
+    def __capture_callback(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio stream callback, called from the audio thread with every captured buffer.
+        Queues the buffer for sending. If the queue is full, the oldest buffer is dropped to keep latency bounded.
+        While streaming is paused, the buffer is discarded without being counted as dropped.
+
+        Args:
+            in_data (bytes): Captured audio.
+            frame_count (int): Number of captured frames.
+            time_info (dict): Stream timing information.
+            status (int): PortAudio status flags.
+
+        Returns:
+            Tuple[None, int]: No output audio and the flag to continue the stream.
+        """
+        if not self._stop_stream_event.is_set():
+            return None, pyaudio.paContinue
+
+        try:
+            self._capture_queue.put_nowait(in_data)
+        except queue.Full:
+            try:
+                self._capture_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+            self._capture_queue.put_nowait(in_data)
+            self._dropped_captured_buffers += 1
+
+        return None, pyaudio.paContinue
+
+    def __drain_capture_queue(self):
+        """
+        Discards buffers captured before streaming was paused.
+        """
+        try:
+            while True:
+                self._capture_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def __send_stream_to_client(self, data: bytes, sequence_header: bytes):
         """
         Encodes and encrypts audio data, then sends it to the client using UDP.
+        The UDP socket is non-blocking, so a packet is dropped instead of stalling capture when the send buffer is full.
+        Each packet starts with its 16-bit sequence number, sent in the clear but authenticated with the payload.
+        Where sendmsg is available, the headers and the payload are sent as one datagram without joining them first.
 
         Args:
             data (bytes): Raw audio data to encode and send.
+            sequence_header (bytes): Packed sequence number of the buffer, assigned in capture order.
         """
-        encoded_data = self._crypto_manager.encrypt_aes_and_sign_data(data)
-        self._udp_socket.sendto(encoded_data, (self._client_address, self._udp_port))
+        buffers = (sequence_header, *self._crypto_manager.encrypt_aes_and_sign_data_buffers(data, sequence_header))
+        try:
+            if self.__is_sendmsg:
+                self._udp_socket.sendmsg(buffers, (), 0, (self._client_address, self._udp_port))
+            else:
+                self._udp_socket.sendto(b''.join(buffers), (self._client_address, self._udp_port))
+        except BlockingIOError:
+            with self.__dropped_packets_lock:
+                self._dropped_packets += 1
@@ -12,7 +12,8 @@ setup(
     install_requires=[
         'PyAudio',
         'cryptography',
-        'chardet'
+        'chardet',
+        "pycaw; sys_platform == 'win32'"
     ],
     entry_points={
         'console_scripts': [
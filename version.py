@@ -1,2 +1,2 @@
 __version__ = '0.4.0'
-__comparability_version__ = '0.4.0'
+__comparability_version__ = '0.6.0'